@@ -0,0 +1,240 @@
+# IMPORTS
+
+# General
+import os
+import sys
+import math
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+import multiprocessing as mp
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Peak RSS (not available on Windows)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Capture
+from capture import InputStream
+
+# Recorder
+from recorder import Recorder, Player
+
+# Recognizer
+from recognizer import recognize_audio, MockRecognizer
+
+# Constants
+from constants import *
+
+
+# CLASSES
+
+# Null audio (stands in for PyAudio without any audio hardware)
+class NullAudio:
+
+    # CONSTRUCTOR
+    def __init__(self, data: bytes = b"", on_end=None, sample_rate: int = SPEECH_SAMPLE_RATES[0]):
+
+        # Define null audio variables
+        self.data = data
+        self.on_end = on_end
+        self.sample_rate = sample_rate
+
+
+    # METHODS
+
+    # Get the null input device
+    def get_default_input_device_info(self) -> dict:
+        return {"index": 0, "defaultSampleRate": float(self.sample_rate)}
+
+    # Check if a format is supported (only the sample rate of the null audio)
+    def is_format_supported(self, sample_rate: int, **kwargs) -> bool:
+        if sample_rate != self.sample_rate:
+            raise ValueError("Invalid sample rate")
+        return True
+
+    # Open a null stream
+    def open(self, **kwargs):
+        return NullStream(self)
+
+
+# Null stream (reads the given data and drops all written data)
+class NullStream:
+
+    # CONSTRUCTOR
+    def __init__(self, audio: NullAudio):
+
+        # Define null stream variables
+        self.audio = audio
+        self.position = 0
+
+
+    # METHODS
+
+    # Read the next chunk and call the end callback, when all data is read
+    def read(self, chunk_size: int, exception_on_overflow: bool = True) -> bytes:
+
+        # Get the chunk
+        size = chunk_size * SAMPLE_WIDTH * CHANNELS
+        data = self.audio.data[self.position:self.position + size]
+        self.position += len(data)
+
+        # Call the end callback
+        if self.position >= len(self.audio.data) and self.audio.on_end is not None:
+            self.audio.on_end()
+        return data
+
+    # Drop the written data
+    def write(self, data: bytes) -> None:
+        pass
+
+    # Stop the stream
+    def stop_stream(self) -> None:
+        pass
+
+    # Close the stream
+    def close(self) -> None:
+        pass
+
+
+# METHODS
+
+# Generate speech-like PCM audio (voiced syllables with formants and pauses)
+def generate_speech(seconds: float, sample_rate: int = SPEECH_SAMPLE_RATES[0], seed: int = 421) -> bytes:
+
+    # Create some different syllables of 250 ms
+    rand = random.Random(seed)
+    syllable_length = sample_rate // 4
+    syllables = []
+    for _ in range(16):
+        pitch = rand.uniform(90, 220)
+        formants = [(rand.uniform(300, 900), 1.0), (rand.uniform(900, 2500), 0.5), (rand.uniform(2500, 3500), 0.2)]
+        samples = array("h")
+        for i in range(syllable_length):
+            t = i / sample_rate
+            envelope = math.sin(math.pi * i / syllable_length) ** 2
+            value = sum(gain * math.sin(2 * math.pi * round(frequency / pitch) * pitch * t) for frequency, gain in formants)
+            samples.append(int(6000 * envelope * value))
+        syllables.append(samples.tobytes())
+    pause = bytes(syllable_length * SAMPLE_WIDTH)
+
+    # Build the audio from words of syllables and pauses
+    total_size = int(seconds * sample_rate) * SAMPLE_WIDTH
+    parts = []
+    size = 0
+    while size < total_size:
+        part = pause if rand.random() < 0.25 else syllables[rand.randrange(len(syllables))]
+        parts.append(part)
+        size += len(part)
+    return b"".join(parts)[:total_size]
+
+
+# Split audio into chunks like the input stream
+def split_frames(data: bytes, chunk_size: int = CHUNK_SIZE) -> list:
+
+    # Return the chunks
+    size = chunk_size * SAMPLE_WIDTH * CHANNELS
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+# Get the peak RSS of the process in bytes
+def get_peak_rss() -> int:
+
+    # Return the peak RSS
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# Run a stage (in a fresh process) and return its measurement
+def run_stage(stage: str, seconds: float, sample_rate: int) -> dict:
+
+    # Prepare the audio and silence the stage prints
+    data = generate_speech(seconds, sample_rate)
+    frames = split_frames(data) if stage != "capture" else None
+    output_audio = os.path.join(tempfile.gettempdir(), f"benchmark_{os.getpid()}.wav")
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    rss_before = get_peak_rss()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+
+    # Run the stage
+    try:
+        if stage == "capture":
+            audio = NullAudio(data, sample_rate=sample_rate)
+            input_stream = InputStream(audio)
+            audio.on_end = input_stream.stop
+            with tempfile.TemporaryDirectory() as segment_root:
+                with ThreadPoolExecutor(1) as executor:
+                    recorder = Recorder(input_stream, executor, segment_root=segment_root)
+                    recorder.start()
+                    input_stream.run()
+                    recorder.stop(output_audio).result()
+                    for future in recorder.segment_futures:
+                        future.result()
+        elif stage == "save":
+            recorder = Recorder(None, None)
+            recorder.frames = frames
+            recorder.sample_rate = sample_rate
+            recorder.save(output_audio)
+        elif stage == "recognize":
+            recognize_audio(frames, MockRecognizer(), sample_rate, SAMPLE_WIDTH, "")
+        elif stage == "play":
+            player = Player(NullAudio())
+            player.frames = frames
+            player.sample_rate = sample_rate
+            player.run()
+
+    # Stop measuring
+    finally:
+        elapsed = time.perf_counter() - start_time
+        _, peak_traced = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        sys.stdout.close()
+        sys.stdout = stdout
+        if os.path.exists(output_audio):
+            os.remove(output_audio)
+
+    # Return the measurement (the peak ratio is the traced memory at the peak relative to the audio size, not a count of copies)
+    return {
+        "stage": stage,
+        "seconds": seconds,
+        "elapsed": elapsed,
+        "throughput": len(data) / elapsed / 1024 / 1024,
+        "realtime": seconds / elapsed,
+        "peak_rss": get_peak_rss(),
+        "stage_rss": max(0, get_peak_rss() - rss_before),
+        "peak_ratio": peak_traced / len(data)
+    }
+
+
+# MAIN
+if __name__ == '__main__':
+
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description=f"Speech Recognition Engine (by {AUTHOR}) [{VERSION}] - Benchmark")
+    parser.add_argument("--lengths", type=float, nargs="+", default=[10, 600, 3600], help="audio lengths in seconds")
+    parser.add_argument("--stages", nargs="+", default=["capture", "save", "recognize", "play"], choices=["capture", "save", "recognize", "play"], help="stages to measure")
+    parser.add_argument("--rate", type=int, default=SPEECH_SAMPLE_RATES[0], help="sample rate of the audio")
+    args = parser.parse_args()
+
+    # Print head
+    print("Speech Recognition Engine - Benchmark")
+    print("-------------------------------------")
+    print("")
+    print(f"{'STAGE':<10} {'LENGTH':>8} {'TIME':>9} {'MB/S':>9} {'REALTIME':>10} {'PEAK RSS':>10} {'STAGE RSS':>10} {'PEAK/AUDIO':>11}")
+
+    # Run every stage in a fresh process, so the peak RSS belongs to the stage
+    for seconds in args.lengths:
+        for stage in args.stages:
+            with ProcessPoolExecutor(1, mp.get_context("spawn")) as process:
+                result = process.submit(run_stage, stage, seconds, args.rate).result()
+            print(f"{result['stage']:<10} {result['seconds']:>7.0f}s {result['elapsed']:>8.3f}s {result['throughput']:>9.1f} {result['realtime']:>9.0f}x "
+                  f"{result['peak_rss'] / 1024 / 1024:>8.1f}MB {result['stage_rss'] / 1024 / 1024:>8.1f}MB {result['peak_ratio']:>11.2f}")
@@ -0,0 +1,372 @@
+# IMPORTS
+
+# General
+import time
+import struct
+import threading as th
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from collections import deque
+
+# Audio
+import pyaudio
+
+# Constants
+from constants import *
+
+
+# CLASSES
+
+# Input stream (always open, keeps the last chunks as pre-roll)
+class InputStream(th.Thread):
+
+    # CONSTRUCTOR
+    def __init__(self, audio, pre_roll: float = PRE_ROLL_SECONDS):
+
+        # Initialize thread
+        th.Thread.__init__(self, name="Input Stream Thread", daemon=True)
+
+        # Define input stream variables
+        self.audio = audio
+        self.running = False
+        self.stream = None
+        self.sample_rate = negotiate_sample_rate(audio)
+        self.reader = None
+        self.pre_roll = deque()
+        self.pre_roll_size = int(pre_roll * self.sample_rate) * SAMPLE_WIDTH * CHANNELS
+        self.pre_roll_length = 0
+        self.listener = None
+        self.lock = th.Lock()
+        self.error = ""
+
+        # Print confirmation
+        print(f"INPUT STREAM: Initialized. (Sample rate: {self.sample_rate} Hz)")
+
+
+    # METHODS
+
+    # Run and read the stream
+    def run(self) -> None:
+
+        # Create and open a audio stream
+        self.stream = self.audio.open(format=SAMPLE_FORMAT, channels=CHANNELS, rate=self.sample_rate, frames_per_buffer=MIN_CHUNK_SIZE, input=True)
+        self.reader = ChunkReader(self.stream, self.sample_rate)
+
+        # Set running to true
+        self.running = True
+
+        # Reading loop
+        print("INPUT STREAM: Start reading ...")
+        while self.running:
+
+            # Read a chunk (stop on an error of the input device)
+            try:
+                data = self.reader.read()
+            except OSError as error:
+                self.error = f"Cannot read the input stream! ({error})"
+                print(f"INPUT STREAM: {self.error}")
+                break
+
+            # Pass the chunk to the pre-roll and the listener
+            with self.lock:
+                self.pre_roll.append(data)
+                self.pre_roll_length += len(data)
+                while self.pre_roll and self.pre_roll_length - len(self.pre_roll[0]) >= self.pre_roll_size:
+                    self.pre_roll_length -= len(self.pre_roll.popleft())
+                if self.listener is not None:
+                    self.listener.add_frame(data)
+
+        # Stop and close the stream
+        print("INPUT STREAM: Stopped reading.")
+        self.stream.stop_stream()
+        self.stream.close()
+
+    # Stop reading
+    def stop(self) -> None:
+
+        # Set running to false
+        self.running = False
+
+    # Attach a recorder, which gets the pre-roll and all following chunks, and return the pre-roll length in seconds
+    def attach(self, recorder) -> float:
+
+        # Copy the pre-roll and set the listener
+        with self.lock:
+            for data in self.pre_roll:
+                recorder.add_frame(data)
+            self.listener = recorder
+            return self.pre_roll_length / (self.sample_rate * SAMPLE_WIDTH * CHANNELS)
+
+    # Detach a recorder
+    def detach(self, recorder) -> None:
+
+        # Remove the listener
+        with self.lock:
+            if self.listener is recorder:
+                self.listener = None
+
+
+# Chunk reader (reads the chunks of a stream and adapts the chunk size to the measured scheduling jitter)
+class ChunkReader:
+
+    # CONSTRUCTOR
+    def __init__(self, stream, sample_rate: int):
+
+        # Define chunk reader variables
+        self.stream = stream
+        self.sample_rate = sample_rate
+        self.chunk_size = CHUNK_SIZE
+        self.jitter = 0.0
+        self.reads = 0
+        self.last_read_time = time.perf_counter()
+
+
+    # METHODS
+
+    # Read the next chunk
+    def read(self) -> bytes:
+
+        # Read a chunk and measure the deviation from the expected chunk time
+        data = self.stream.read(self.chunk_size, False)
+        read_time = time.perf_counter()
+        self.jitter = max(self.jitter, abs(read_time - self.last_read_time - self.chunk_size / self.sample_rate))
+        self.last_read_time = read_time
+
+        # Adapt the chunk size to the measured jitter every few reads
+        self.reads += 1
+        if self.reads >= ADAPT_CHUNK_READS:
+            chunk_size = adapt_chunk_size(self.jitter, self.sample_rate)
+            if chunk_size != self.chunk_size:
+                print(f"INPUT STREAM: Adapted chunk size to {chunk_size}. (Jitter: {self.jitter * 1000:.1f} ms)")
+                self.chunk_size = chunk_size
+            self.reads = 0
+            self.jitter = 0.0
+        return data
+
+
+# Process input stream (reads the stream in a separate process and shares the audio in a ring buffer)
+class ProcessInputStream(th.Thread):
+
+    # CONSTRUCTOR
+    def __init__(self, pre_roll: float = PRE_ROLL_SECONDS, buffer_length: float = CAPTURE_BUFFER_SECONDS):
+
+        # Initialize thread
+        th.Thread.__init__(self, name="Process Input Stream Thread", daemon=True)
+
+        # Define process input stream variables
+        context = mp.get_context("spawn")
+        self.running = False
+
+        # The buffer is sized before the sample rate is negotiated, so it holds the given length at up to the highest speech sample
+        # rate (at a higher default rate of the device it holds less)
+        self.buffer_size = int(buffer_length * max(SPEECH_SAMPLE_RATES)) * SAMPLE_WIDTH * CHANNELS
+        self.memory = shared_memory.SharedMemory(create=True, size=RING_HEADER_SIZE + self.buffer_size)
+        self.stopped = context.Event()
+        self.ready = context.Event()
+        self.process = context.Process(target=run_capture_process, args=(self.memory.name, self.buffer_size, self.stopped, self.ready), name="Capture Process", daemon=True)
+        self.pre_roll_size = 0
+        self.read_position = 0
+        self.dropped = 0
+        self.listener = None
+        self.lock = th.Lock()
+        self.error = ""
+
+        # Start the capture process and wait for the negotiated sample rate (stop it and release the shared memory on a timeout)
+        self.process.start()
+        if not self.ready.wait(10):
+            self.process.terminate()
+            self.process.join(5)
+            self.memory.close()
+            self.memory.unlink()
+            raise RuntimeError("Cannot start the capture process!")
+        self.sample_rate = struct.unpack_from("<I", self.memory.buf, 16)[0]
+        self.pre_roll_size = int(pre_roll * self.sample_rate) * SAMPLE_WIDTH * CHANNELS
+        self.buffer_length = self.buffer_size / (self.sample_rate * SAMPLE_WIDTH * CHANNELS)
+
+        # Print confirmation
+        print(f"PROCESS INPUT STREAM: Initialized. (Sample rate: {self.sample_rate} Hz, Buffer: {self.buffer_length:.1f} sec)")
+
+
+    # METHODS
+
+    # Run and pass the new audio of the ring buffer to the listener
+    def run(self) -> None:
+
+        # Set running to true
+        self.running = True
+
+        # Reading loop
+        print("PROCESS INPUT STREAM: Start reading ...")
+        while self.running and self.process.is_alive():
+
+            # Pass the new audio to the listener
+            with self.lock:
+                write_position = self.get_write_position()
+                if write_position - self.read_position > self.buffer_size:
+                    self.dropped += write_position - self.read_position - self.buffer_size
+                    print(f"PROCESS INPUT STREAM: Dropped audio! (Dropped: {self.dropped} bytes)")
+                    self.read_position = write_position - self.buffer_size
+                if self.listener is not None and write_position > self.read_position:
+                    self.listener.add_frame(self.read(self.read_position, write_position))
+                self.read_position = write_position
+
+            # Wait for new audio
+            time.sleep(CAPTURE_POLL_SECONDS)
+
+        # Report the failure, if the capture process ended while running (like on an error of the input device)
+        if self.running:
+            self.error = f"The capture process ended unexpectedly! (Exit code: {self.process.exitcode})"
+            print(f"PROCESS INPUT STREAM: {self.error}")
+        else:
+            print("PROCESS INPUT STREAM: Stopped reading.")
+
+        # Remove the listener, stop the capture process and release the shared memory
+        with self.lock:
+            self.listener = None
+        self.stopped.set()
+        self.process.join(5)
+        self.memory.close()
+        self.memory.unlink()
+
+    # Stop reading
+    def stop(self) -> None:
+
+        # Set running to false
+        self.running = False
+
+    # Get the position, up to which the capture process has written the audio
+    def get_write_position(self) -> int:
+
+        # Return the written position
+        return struct.unpack_from("<Q", self.memory.buf, 8)[0]
+
+    # Get the position, up to which the capture process may be writing the audio right now
+    def get_writing_position(self) -> int:
+
+        # Return the writing position
+        return struct.unpack_from("<Q", self.memory.buf, 0)[0]
+
+    # Read the audio between two absolute positions out of the ring buffer (without the start, if it is overwritten while copying)
+    def read(self, start: int, end: int) -> bytes:
+
+        # Get the position in the ring buffer
+        offset = start % self.buffer_size
+        size = end - start
+
+        # Copy the audio out of the shared memory (in two parts, if it wraps around)
+        buffer = self.memory.buf
+        first = min(size, self.buffer_size - offset)
+        if first == size:
+            data = bytes(buffer[RING_HEADER_SIZE + offset:RING_HEADER_SIZE + offset + size])
+        else:
+            data = b"".join((buffer[RING_HEADER_SIZE + offset:RING_HEADER_SIZE + self.buffer_size], buffer[RING_HEADER_SIZE:RING_HEADER_SIZE + size - first]))
+
+        # Drop the audio, which the capture process overwrote or started to overwrite while copying (the writing position is published
+        # before every chunk is written, so it is checked after the copy)
+        overwritten = self.get_writing_position() - self.buffer_size - start
+        if overwritten > 0:
+            overwritten = min(overwritten, size)
+            self.dropped += overwritten
+            print(f"PROCESS INPUT STREAM: Dropped audio! (Dropped: {self.dropped} bytes)")
+            data = data[overwritten:]
+        return data
+
+    # Attach a recorder, which gets the pre-roll and all following audio, and return the pre-roll length in seconds
+    def attach(self, recorder) -> float:
+
+        # Read the pre-roll straight out of the ring buffer and set the listener
+        with self.lock:
+            write_position = self.get_write_position()
+            start = max(0, write_position - self.pre_roll_size)
+            if write_position > start:
+                recorder.add_frame(self.read(start, write_position))
+            self.read_position = write_position
+            self.listener = recorder
+            return (write_position - start) / (self.sample_rate * SAMPLE_WIDTH * CHANNELS)
+
+    # Detach a recorder
+    def detach(self, recorder) -> None:
+
+        # Pass the last audio and remove the listener
+        with self.lock:
+            if self.listener is recorder:
+                write_position = self.get_write_position()
+                if write_position > self.read_position:
+                    recorder.add_frame(self.read(self.read_position, write_position))
+                self.read_position = write_position
+                self.listener = None
+
+
+# METHODS
+
+# Run the capture process (reads the input stream into the shared memory ring buffer)
+def run_capture_process(memory_name: str, buffer_size: int, stopped, ready) -> None:
+
+    # Attach to the shared memory and open the audio stream
+    memory = shared_memory.SharedMemory(memory_name)
+    buffer = memory.buf
+    audio = pyaudio.PyAudio()
+    sample_rate = negotiate_sample_rate(audio)
+    stream = audio.open(format=SAMPLE_FORMAT, channels=CHANNELS, rate=sample_rate, frames_per_buffer=MIN_CHUNK_SIZE, input=True)
+    struct.pack_into("<I", buffer, 16, sample_rate)
+    ready.set()
+
+    # Reading loop
+    reader = ChunkReader(stream, sample_rate)
+    position = 0
+    while not stopped.is_set():
+
+        # Read a chunk
+        data = reader.read()
+
+        # Publish the end of the chunk as writing position, write the chunk into the ring buffer (in two parts, if it wraps around)
+        # and publish the end of the chunk as written position
+        struct.pack_into("<Q", buffer, 0, position + len(data))
+        offset = position % buffer_size
+        first = min(len(data), buffer_size - offset)
+        buffer[RING_HEADER_SIZE + offset:RING_HEADER_SIZE + offset + first] = data[:first]
+        if first < len(data):
+            buffer[RING_HEADER_SIZE:RING_HEADER_SIZE + len(data) - first] = data[first:]
+        position += len(data)
+        struct.pack_into("<Q", buffer, 8, position)
+
+    # Stop and close the stream and the shared memory
+    stream.stop_stream()
+    stream.close()
+    audio.terminate()
+    del buffer
+    memory.close()
+
+
+# Get the lowest sample rate, which is good enough for speech and supported by the input device
+def negotiate_sample_rate(audio) -> int:
+
+    # Get the default input device
+    try:
+        device = audio.get_default_input_device_info()
+    except IOError:
+        return SAMPLES_PER_SECOND
+
+    # Try every speech sample rate from the lowest
+    for sample_rate in SPEECH_SAMPLE_RATES:
+        try:
+            if audio.is_format_supported(sample_rate, input_device=device["index"], input_channels=CHANNELS, input_format=SAMPLE_FORMAT):
+                return sample_rate
+        except ValueError:
+            continue
+
+    # Return the default sample rate of the device
+    return int(device["defaultSampleRate"])
+
+
+# Get a chunk size (power of two), which is large enough to absorb the scheduling jitter
+def adapt_chunk_size(jitter: float, sample_rate: int) -> int:
+
+    # Get the needed chunk size
+    needed = jitter * JITTER_FACTOR * sample_rate
+
+    # Return the next power of two between the limits
+    chunk_size = MIN_CHUNK_SIZE
+    while chunk_size < needed and chunk_size < MAX_CHUNK_SIZE:
+        chunk_size *= 2
+    return chunk_size
@@ -10,14 +10,53 @@ VERSION = "Beta 2.1"
 
 # Audio settings
 CHUNK_SIZE = 1024
+MIN_CHUNK_SIZE = 512
+MAX_CHUNK_SIZE = 4096
+ADAPT_CHUNK_READS = 64
+JITTER_FACTOR = 4
 SAMPLE_FORMAT = pa.paInt16
+SAMPLE_WIDTH = pa.get_sample_size(SAMPLE_FORMAT)
 CHANNELS = 1
 SAMPLES_PER_SECOND = 44100
+SPEECH_SAMPLE_RATES = (16000, 22050, 32000, 44100, 48000)
+PRE_ROLL_SECONDS = 0.3
+
+# Capture process settings (capture in a separate process with a shared memory ring buffer, which holds the buffer seconds at
+# up to the highest speech sample rate and starts after a header with the writing position, the written position and the sample rate)
+CAPTURE_PROCESS = False
+CAPTURE_BUFFER_SECONDS = 10
+CAPTURE_POLL_SECONDS = 0.02
+RING_HEADER_SIZE = 64
+
+# Recognition settings
+LANGUAGE = "de"
+LANGUAGES = ("de", "en-US")
+UNRECOGNIZABLE_ERROR = "Error on recognizing: Unable to recognize data!"
 
 # Output files
 OUTPUT_AUDIO = "Latest.wav"
 OUTPUT_TEXT = "Latest.txt"
 
+# Session settings
+RECOGNIZER_WORKERS = 3
+MAX_SESSIONS = 12
+SESSION_ROWS = 3
+
+# Segment settings
+SEGMENT_SECONDS = 300
+SEGMENT_DIRECTORY = "Segments"
+SEGMENT_MANIFEST = "manifest.json"
+
+# Server settings
+SERVER_HOST = "0.0.0.0"
+SERVER_PORT = 8421
+SERVER_WORKERS = 2
+SERVER_QUEUE_SIZE = 16
+SERVER_MAX_JOBS = 256
+SERVER_MAX_UPLOAD_SIZE = 200 * 1024 * 1024
+SERVER_PARTIAL_SECONDS = 30
+SERVER_MAX_LANGUAGES = 4
+
 # States
 S_IDLE = 421
 S_RECORD = 422
@@ -27,3 +66,4 @@ S_SHOW_RECORD_RESULT = 425
 S_SELECT_FILE = 426
 S_RECOGNIZE_FILE = 427
 S_SHOW_FILE_RESULT = 428
+S_SHOW_SESSIONS = 429
@@ -3,9 +3,9 @@
 # General
 import sys
 import os
-import time
 import traceback
 import threading as th
+from concurrent.futures import ThreadPoolExecutor
 
 # GUI
 import pygame as pg
@@ -14,11 +14,22 @@ import easygui
 # Audio
 import pyaudio
 import speech_recognition as sp_rec
-import wave
 
 # Clipboard
 import pyperclip
 
+# Capture
+from capture import InputStream, ProcessInputStream
+
+# Recorder
+from recorder import Recorder, Player, format_time
+
+# Session
+from session import Session
+
+# Recognizer
+from recognizer import recognize_audio_languages, save_text
+
 # Constants
 from constants import *
 
@@ -32,138 +43,14 @@ import font
 if not "draw" in sys.modules: import draw
 
 
-# CLASSES
-
-# Recorder
-class Recorder(th.Thread):
-
-    # CONSTRUCTOR
-    def __init__(self):
-
-        # Initialize thread
-        th.Thread.__init__(self, name="Recorder Thread")
-
-        # Define recorder variables
-        self.recording = False
-        self.stream = None
-        self.frames = []
-        self.record_start_time = 0
-        self.record_end_time = 0
-
-        # Print confirmation
-        print("RECORDER: Initialized.")
-
-
-    # METHODS
-
-    # Run and start recording
-    def run(self) -> None:
-
-        # Create and open a audio stream
-        self.stream = pa.open(format=SAMPLE_FORMAT, channels=CHANNELS, rate=SAMPLES_PER_SECOND, frames_per_buffer=CHUNK_SIZE, input=True)
-
-        # Set recording to true
-        self.recording = True
-
-        # Set the start record time
-        self.record_start_time = time.time()
+# VARIABLES
 
-        # Recording loop
-        print("RECORDER: Start recording ...")
-        while self.recording:
+# Events
+E_RECORD_STOPPED = pg.USEREVENT + 1
+E_RECOGNIZED = pg.USEREVENT + 2
 
-            # Store the data in chunks
-            for i in range(int(SAMPLES_PER_SECOND / CHUNK_SIZE)):
-                data = self.stream.read(CHUNK_SIZE, False)
-                self.frames.append(data)
-                self.record_end_time = time.time()
-
-        # Stop and close the stream
-        print(f"RECORDER: Stopped recording. (Length: {format_time(self.get_record_time())})")
-        self.stream.stop_stream()
-        self.stream.close()
-        self.save()
-
-    # Stop recording
-    def stop(self) -> None:
-
-        # Set recording to false
-        self.recording = False
-
-    # Save the recorded audio to file
-    def save(self) -> None:
-
-        # Open the wav file
-        print(f"RECORDER: Save audio at '{OUTPUT_AUDIO}' ...")
-        with wave.open(OUTPUT_AUDIO, "wb") as file:
-
-            # Set the data
-            file.setnchannels(CHANNELS)
-            file.setsampwidth(pa.get_sample_size(SAMPLE_FORMAT))
-            file.setframerate(SAMPLES_PER_SECOND)
-
-            # Write the frames
-            file.writeframes(b''.join(self.frames))
-        print(f"RECORDER: Audio saved.")
-
-    # Get recording time
-    def get_record_time(self) -> float:
-
-        # Return the calculated time
-        if self.record_start_time == 0 or self.record_end_time == 0:
-            return 0
-        else:
-            return float(f"{self.record_end_time - self.record_start_time:.2f}")
-
-
-# Player
-class Player(th.Thread):
-
-    # CONSTRUCTOR
-    def __init__(self):
-
-        # Initialize thread
-        th.Thread.__init__(self, name="Player Thread")
-
-        # Define player variables
-        self.playing = False
-        self.stream = None
-        self.frames = []
-
-        # Print confirmation
-        print("PLAYER: Initialized.")
-
-
-    # METHODS
-
-    # Run and start playing
-    def run(self) -> None:
-
-        # Create and open a audio stream
-        self.stream = pa.open(format=SAMPLE_FORMAT, channels=CHANNELS, rate=SAMPLES_PER_SECOND, frames_per_buffer=CHUNK_SIZE, output=True)
-
-        # Set playing to true
-        self.playing = True
-
-        # Playing loop
-        print("PLAYER: Start playing ...")
-        for data in self.frames:
-            if not self.playing:
-                break
-            self.stream.write(data)
-
-        # Stop and close the stream
-        print("PLAYER: Stopped playing.")
-        self.playing = False
-        self.stream.stop_stream()
-        self.stream.close()
-
-    # Stop playing
-    def stop(self) -> None:
-
-        # Set playing to false
-        self.playing = False
 
+# CLASSES
 
 # Controller
 class Controller(th.Thread):
@@ -183,9 +70,10 @@ class Controller(th.Thread):
         self.running = True
         self.state = S_IDLE
         self.cannot_close_on_recording_msg_timer = 0
-        self.result = None
-        self.recognizing_start_time = 0
-        self.recognizing_end_time = 0
+        self.sessions = []
+        self.session = None
+        self.sessions_offset = 0
+        self.saved_session_number = 0
 
         # Define mouse variables
         self.m_left_down = False
@@ -232,9 +120,6 @@ class Controller(th.Thread):
     # Handle events
     def handle_events(self) -> None:
 
-        # Set the recorder global
-        global recorder
-
         # Reset variables
         self.m_left_down = False
         self.m_right_down = False
@@ -254,7 +139,7 @@ class Controller(th.Thread):
             if event.type == pg.QUIT:
 
                 # If the recorder is not recording, set running to false
-                if not recorder.recording and self.state != S_STOP_RECORD:
+                if self.state != S_RECORD and self.state != S_STOP_RECORD:
                     print("CONTROLLER: Closed window.")
                     self.running = False
                 # Else, set cannot close on recording message timer to 255
@@ -276,8 +161,8 @@ class Controller(th.Thread):
                     if self.state == S_RECORD or self.state == S_STOP_RECORD:
                         print("CONTROLLER: Cannot close window, while recording!")
                         self.cannot_close_on_recording_msg_timer = 255
-                    # If the state is SHOW RECORD RESULT or RECOGNIZE RECORD, go to IDLE
-                    if self.state == S_SHOW_RECORD_RESULT or self.state == S_RECOGNIZE_RECORD:
+                    # If the state is SHOW RECORD RESULT, RECOGNIZE RECORD or SHOW SESSIONS, go to IDLE
+                    if self.state == S_SHOW_RECORD_RESULT or self.state == S_RECOGNIZE_RECORD or self.state == S_SHOW_SESSIONS:
                         print("CONTROLLER: Switched back into menu.")
                         self.state = S_IDLE
 
@@ -289,21 +174,49 @@ class Controller(th.Thread):
                         print("CONTROLLER: Select file to recognize ...")
                         self.state = S_SELECT_FILE
                     elif event.key == pg.K_2:
-                        print("CONTROLLER: Reinitialize the recorder ...")
-                        recorder = Recorder()
-                        print("CONTROLLER: Run the recorder ...")
-                        recorder.start()
-                        self.state = S_RECORD
+                        self.start_record()
                     elif event.key == pg.K_3:
                         print("CONTROLLER: Closed window.")
                         self.running = False
 
-                # If the space key pressed and the state is RECORD, stop recording
-                if event.key == pg.K_SPACE and self.state == S_RECORD and recorder.recording:
-                    print("CONTROLLER: Waiting for recorder stopped ...")
-                    recorder.stop()
-                    th.Thread(name="Wait Recorder Stop and Recognizer Thread", target=self.wait_record_stop_and_recognize).start()
-                    self.state = S_STOP_RECORD
+                # If the space key pressed and the state is RECORD, stop recording, else if a session is shown, record the next session
+                if event.key == pg.K_SPACE and self.state == S_RECORD and self.session.recorder.recording:
+                    self.stop_record()
+                elif event.key == pg.K_SPACE and (self.state == S_RECOGNIZE_RECORD or self.state == S_SHOW_RECORD_RESULT or self.state == S_SHOW_SESSIONS):
+                    self.start_record()
+
+            # If the recorder of a session stopped, report an error on saving and recognize the recorded audio
+            if event.type == E_RECORD_STOPPED:
+                print(f"CONTROLLER: Recorder of session #{event.session.number} stopped.")
+                if event.error is not None:
+                    print(f"CONTROLLER: Error on saving the audio of session #{event.session.number}!")
+                    print("--------------")
+                    print("ERROR MESSAGE:")
+                    print("".join(traceback.format_exception(event.error))[:-1])
+                    print("--------------")
+                self.recognize_record(event.session)
+                if event.session is self.session and self.state == S_STOP_RECORD:
+                    self.state = S_RECOGNIZE_RECORD
+
+            # If the recognition of a session finished, show the result, if the session is shown, and save the text, if no newer session is saved
+            if event.type == E_RECOGNIZED and event.session.finish(event.future):
+                if event.session.result[0] == "#ERROR#":
+                    print(f"RESULT #{event.session.number}: -")
+                    print("--------------")
+                else:
+                    print("-------")
+                    print(f"RESULT #{event.session.number}:")
+                    print(event.session.result[0])
+                    print("-------")
+                    if event.session.number >= self.saved_session_number:
+                        save_text(event.session.result[0])
+                        self.saved_session_number = event.session.number
+                if event.session is self.session and self.state == S_RECOGNIZE_RECORD:
+                    self.state = S_SHOW_RECORD_RESULT
+
+            # If the mouse wheel scrolled and the state is SHOW SESSIONS, scroll the sessions
+            if event.type == pg.MOUSEWHEEL and self.state == S_SHOW_SESSIONS:
+                self.sessions_offset = max(0, min(len(self.sessions) - SESSION_ROWS, self.sessions_offset - event.y))
 
             # If a mouse button pressed down
             if event.type == pg.MOUSEBUTTONDOWN:
@@ -319,11 +232,15 @@ class Controller(th.Thread):
                 if event.button == pg.BUTTON_LEFT: self.m_left_up = True
                 if event.button == pg.BUTTON_RIGHT: self.m_right_up = True
 
+        # If the input stream failed while recording, stop recording
+        if input_stream.error and self.state == S_RECORD and self.session.recorder.recording:
+            print(f"CONTROLLER: Input stream failed! ({input_stream.error})")
+            self.stop_record()
+
     # Update screen
     def update_screen(self) -> None:
 
-        # Set the recorder and player global
-        global recorder
+        # Set the player global
         global player
 
         # Fill the screen
@@ -339,11 +256,7 @@ class Controller(th.Thread):
                 print("CONTROLLER: Select file to recognize ...")
                 self.state = S_SELECT_FILE
             if draw.draw_color_text_button(125, 210, 300, 40, self, self.screen, "Record and Recognize", font.HP_SIMPLIFIED_22, color.DARK_LIME, (-30, -30, -30), color.BLACK)[1]:
-                print("CONTROLLER: Reinitialize the recorder ...")
-                recorder = Recorder()
-                print("CONTROLLER: Run the recorder ...")
-                recorder.start()
-                self.state = S_RECORD
+                self.start_record()
             if draw.draw_color_text_button(125, 260, 300, 40, self, self.screen, "Quit", font.HP_SIMPLIFIED_22, color.ORANGE, (-30, -30, -30), color.BLACK)[1]:
                 print("CONTROLLER: Closed window.")
                 self.running = False
@@ -354,23 +267,12 @@ class Controller(th.Thread):
             pg.draw.rect(self.screen, color.LIGHT_GRAY, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 60, menu_title.get_width() + 20, menu_title.get_height() + 8])
             pg.draw.rect(self.screen, color.BLACK, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 60, menu_title.get_width() + 20, menu_title.get_height() + 8], 3)
             self.screen.blit(menu_title, (self.s_width // 2 - menu_title.get_width() // 2, 63))
-            if recorder.get_record_time() >= 3599 and not self.state == S_STOP_RECORD:
-                print("CONTROLLER: Waiting for recorder stopped ...")
-                recorder.stop()
-                th.Thread(name="Wait Recorder Stop and Recognizer Thread", target=self.wait_record_stop_and_recognize).start()
-                self.state = S_STOP_RECORD
-            if recorder.get_record_time() > 3540:
-                recording_time = font.render_text(format_time(recorder.get_record_time()), font.HP_SIMPLIFIED_35, color.DARK_RED)
-            else:
-                recording_time = font.render_text(format_time(recorder.get_record_time()), font.HP_SIMPLIFIED_35, color.BLACK)
+            recording_time = font.render_text(format_time(self.session.recorder.get_record_time()), font.HP_SIMPLIFIED_35, color.BLACK)
             pg.draw.rect(self.screen, color.YELLOW, [(self.s_width // 2 - recording_time.get_width() // 2) - 10, 160, recording_time.get_width() + 20, recording_time.get_height() + 20])
             pg.draw.rect(self.screen, color.BLACK, [(self.s_width // 2 - recording_time.get_width() // 2) - 10, 160, recording_time.get_width() + 20, recording_time.get_height() + 20], 3)
             self.screen.blit(recording_time, (self.s_width // 2 - recording_time.get_width() // 2, 170))
-            if draw.draw_color_text_button(125, 250, 300, 40, self, self.screen, "Stop Recording", font.HP_SIMPLIFIED_22, color.RED, (-30, -30, -30), color.BLACK)[1] and self.state == S_RECORD and recorder.recording:
-                print("CONTROLLER: Waiting for recorder stopped ...")
-                recorder.stop()
-                th.Thread(name="Wait Recorder Stop and Recognizer Thread", target=self.wait_record_stop_and_recognize).start()
-                self.state = S_STOP_RECORD
+            if draw.draw_color_text_button(125, 250, 300, 40, self, self.screen, "Stop Recording", font.HP_SIMPLIFIED_22, color.RED, (-30, -30, -30), color.BLACK)[1] and self.state == S_RECORD and self.session.recorder.recording:
+                self.stop_record()
             elif self.state == S_STOP_RECORD:
                 black_mask = pg.Surface((self.s_width, self.s_height))
                 black_mask.fill(color.BLACK)
@@ -381,53 +283,48 @@ class Controller(th.Thread):
 
         # If the state is RECOGNIZE RECORD, draw the recognize record message text
         elif self.state == S_RECOGNIZE_RECORD:
-            self.recognizing_end_time = time.time()
-            menu_title = font.render_text("Recognizing", font.HARNGTON_50, color.GREEN)
+            menu_title = font.render_text(f"Recognizing #{self.session.number}", font.HARNGTON_50, color.GREEN)
             pg.draw.rect(self.screen, color.LIGHT_GRAY, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 30, menu_title.get_width() + 20, menu_title.get_height() + 8])
             pg.draw.rect(self.screen, color.BLACK, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 30, menu_title.get_width() + 20, menu_title.get_height() + 8], 3)
             self.screen.blit(menu_title, (self.s_width // 2 - menu_title.get_width() // 2, 33))
-            pg.draw.rect(self.screen, color.GRAY.modify((15, 15, 15)), [20, 110, self.s_width - 40, self.s_height - 150])
-            current_recognizing_time = font.render_text(f"Recognizing recorded audio ... ({int(self.recognizing_end_time - self.recognizing_start_time)} sec)", font.NOTOMONO_20, color.BLACK)
-            self.screen.blit(current_recognizing_time, (self.s_width // 2 - current_recognizing_time.get_width() // 2, 140))
-            audio_length_text = font.render_text(f"Length of the recorded audio: {format_time(recorder.get_record_time())[:-3]}", font.NOTOMONO_20, color.BLACK)
-            self.screen.blit(audio_length_text, (self.s_width // 2 - audio_length_text.get_width() // 2, 200))
-            warning_text = font.render_text("This process can take some time ...", font.NOTOMONO_20, color.BLACK)
-            self.screen.blit(warning_text, (self.s_width // 2 - warning_text.get_width() // 2, 260))
-            if self.result != ("#LOADING#", "", ""):
-                if self.result[0] == "#ERROR#":
-                    print("RESULT: -")
-                    print("--------------")
-                else:
-                    print("-------")
-                    print("RESULT:")
-                    print(self.result[0])
-                    print("-------")
-                self.state = S_SHOW_RECORD_RESULT
+            pg.draw.rect(self.screen, color.GRAY.modify((15, 15, 15)), [20, 110, self.s_width - 40, 150])
+            current_recognizing_time = font.render_text(f"Recognizing recorded audio ... ({int(self.session.get_recognizing_time())} sec)", font.NOTOMONO_20, color.BLACK)
+            self.screen.blit(current_recognizing_time, (self.s_width // 2 - current_recognizing_time.get_width() // 2, 125))
+            audio_length_text = font.render_text(f"Length of the recorded audio: {format_time(self.session.recorder.get_record_time())[:-3]}", font.NOTOMONO_20, color.BLACK)
+            self.screen.blit(audio_length_text, (self.s_width // 2 - audio_length_text.get_width() // 2, 170))
+            warning_text = font.render_text("You can already record the next take ...", font.NOTOMONO_20, color.BLACK)
+            self.screen.blit(warning_text, (self.s_width // 2 - warning_text.get_width() // 2, 215))
+            if draw.draw_color_text_button(30, 270, 240, 40, self, self.screen, "Record next", font.HP_SIMPLIFIED_22, color.PURPLE, (30, 30, 30), color.WHITE)[1]:
+                self.start_record()
+            if draw.draw_color_text_button(280, 270, 240, 40, self, self.screen, "Sessions", font.HP_SIMPLIFIED_22, color.AQUA, (-30, -30, -30), color.BLACK)[1]:
+                print("CONTROLLER: Switched into sessions.")
+                self.state = S_SHOW_SESSIONS
 
         # If the state is SHOW RECORD RESULT, draw the result data
         elif self.state == S_SHOW_RECORD_RESULT:
-            menu_title = font.render_text("Result", font.HARNGTON_50, color.PURPLE)
+            result = self.session.result
+            menu_title = font.render_text(f"Result #{self.session.number}", font.HARNGTON_50, color.PURPLE)
             pg.draw.rect(self.screen, color.LIGHT_GRAY, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 30, menu_title.get_width() + 20, menu_title.get_height() + 8])
             pg.draw.rect(self.screen, color.BLACK, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 30, menu_title.get_width() + 20, menu_title.get_height() + 8], 3)
             self.screen.blit(menu_title, (self.s_width // 2 - menu_title.get_width() // 2, 33))
             pg.draw.rect(self.screen, color.GRAY.modify((15, 15, 15)), [20, 110, self.s_width - 40, 150])
-            if self.result[0] == "#ERROR#":
+            if result[0] == "#ERROR#":
                 if draw.draw_color_text_button(30, 120, 200, 40, self, self.screen, "Show Error Report", font.HP_SIMPLIFIED_22, color.AQUA, (-30, -30, -30), color.BLACK)[1]:
                     print("CONTROLLER: Open error report ...")
-                    easygui.textbox(self.result[2], "Speech Recognition - Error Report", self.result[1], True)
+                    easygui.textbox(result[2], "Speech Recognition - Error Report", result[1], True)
                     print("CONTROLLER: Closed error report.")
                 if draw.draw_color_text_button(30, 165, 200, 40, self, self.screen, "Recognize again", font.HP_SIMPLIFIED_22, color.BROWN, (30, 30, 30), color.WHITE)[1]:
                     print("CONTROLLER: Try recognizing again ...")
-                    th.Thread(name="Recognizer Thread", target=self.recognize_record).start()
+                    self.recognize_record(self.session)
                     self.state = S_RECOGNIZE_RECORD
             else:
                 if draw.draw_color_text_button(30, 120, 200, 40, self, self.screen, "Show Text Result", font.HP_SIMPLIFIED_22, color.YELLOW, (-30, -30, -30), color.BLACK)[1]:
                     print("CONTROLLER: Open text result window ...")
-                    easygui.textbox("Result text of the recorded audio:", "Speech Recognition - Text Result", self.result[0])
+                    easygui.textbox("Result text of the recorded audio:", "Speech Recognition - Text Result", result[0])
                     print("CONTROLLER: Closed text result window.")
                 if draw.draw_color_text_button(30, 165, 200, 40, self, self.screen, "Copy Text Result", font.HP_SIMPLIFIED_22, color.BLUE, (30, 30, 30), color.WHITE)[1]:
                     print("CONTROLLER: Copied result text to clipboard.")
-                    pyperclip.copy(self.result[0])
+                    pyperclip.copy(result[0])
             if player.playing:
                 if draw.draw_color_text_button(30, 210, 200, 40, self, self.screen, "Stop playing", font.HP_SIMPLIFIED_22, color.RED, (-30, -30, -30), color.BLACK)[1]:
                     print("CONTROLLER: Stop playing ...")
@@ -435,29 +332,53 @@ class Controller(th.Thread):
             else:
                 if draw.draw_color_text_button(30, 210, 200, 40, self, self.screen, "Play Audio", font.HP_SIMPLIFIED_22, color.DARK_LIME, (-30, -30, -30), color.BLACK)[1]:
                     print("CONTROLLER: Reinitialize the player ...")
-                    player = Player()
-                    player.frames = recorder.frames
+                    player = Player(pa)
+                    player.frames = self.session.recorder.frames
+                    player.files = self.session.recorder.get_segment_files()
+                    player.sample_rate = self.session.recorder.sample_rate
                     print("CONTROLLER: Run the player ...")
                     player.start()
             pg.draw.rect(self.screen, color.LIGHT_GRAY.modify((-40, -40, -40)), [240, 120, 280, 130])
-            if self.result[0] == "#ERROR#":
+            if result[0] == "#ERROR#":
                 confirmation1_text = font.render_text("Error on recognizing!", font.NOTOMONO_20, color.RED)
                 confirmation2_text = font.render_text("I'm sorry! :-(", font.NOTOMONO_20, color.RED)
                 self.screen.blit(confirmation1_text, (255, 130))
                 self.screen.blit(confirmation2_text, (290, 174))
             else:
                 confirmation1_text = font.render_text("Successfully completed", font.NOTOMONO_20, color.DARK_LIME)
-                confirmation2_text = font.render_text(f"recognition in {int(self.recognizing_end_time - self.recognizing_start_time)} sec.", font.NOTOMONO_20, color.DARK_LIME)
+                confirmation2_text = font.render_text(f"recognition in {int(self.session.get_recognizing_time())} sec.", font.NOTOMONO_20, color.DARK_LIME)
                 self.screen.blit(confirmation1_text, (248, 130))
                 self.screen.blit(confirmation2_text, (248, 174))
-            audio_length_text = font.render_text(f"Audio length: {format_time(recorder.get_record_time())[:-3]}", font.NOTOMONO_20, color.BLACK)
+            audio_length_text = font.render_text(f"Audio length: {format_time(self.session.recorder.get_record_time())[:-3]}", font.NOTOMONO_20, color.BLACK)
             self.screen.blit(audio_length_text, (267, 217))
-            if draw.draw_color_text_button(30, 270, 240, 40, self, self.screen, "Record again", font.HP_SIMPLIFIED_22, color.PURPLE, (30, 30, 30), color.WHITE)[1]:
-                print("CONTROLLER: Reinitialize the recorder ...")
-                recorder = Recorder()
-                print("CONTROLLER: Run the recorder ...")
-                recorder.start()
-                self.state = S_RECORD
+            if draw.draw_color_text_button(30, 270, 160, 40, self, self.screen, "Record again", font.HP_SIMPLIFIED_22, color.PURPLE, (30, 30, 30), color.WHITE)[1]:
+                self.start_record()
+            if draw.draw_color_text_button(195, 270, 160, 40, self, self.screen, "Sessions", font.HP_SIMPLIFIED_22, color.AQUA, (-30, -30, -30), color.BLACK)[1]:
+                print("CONTROLLER: Switched into sessions.")
+                self.state = S_SHOW_SESSIONS
+            if draw.draw_color_text_button(360, 270, 160, 40, self, self.screen, "Back to Menu", font.HP_SIMPLIFIED_22, color.ORANGE, (-30, -30, -30), color.BLACK)[1]:
+                print("CONTROLLER: Switched back into menu.")
+                self.state = S_IDLE
+
+        # If the state is SHOW SESSIONS, draw the list of the sessions
+        elif self.state == S_SHOW_SESSIONS:
+            menu_title = font.render_text("Sessions", font.HARNGTON_50, color.AQUA)
+            pg.draw.rect(self.screen, color.LIGHT_GRAY, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 30, menu_title.get_width() + 20, menu_title.get_height() + 8])
+            pg.draw.rect(self.screen, color.BLACK, [self.s_width // 2 - menu_title.get_width() // 2 - 10, 30, menu_title.get_width() + 20, menu_title.get_height() + 8], 3)
+            self.screen.blit(menu_title, (self.s_width // 2 - menu_title.get_width() // 2, 33))
+            pg.draw.rect(self.screen, color.GRAY.modify((15, 15, 15)), [20, 110, self.s_width - 40, 150])
+            if not self.sessions:
+                no_sessions_text = font.render_text("No sessions recorded yet.", font.NOTOMONO_20, color.BLACK)
+                self.screen.blit(no_sessions_text, (self.s_width // 2 - no_sessions_text.get_width() // 2, 170))
+            for row, session in enumerate(list(reversed(self.sessions))[self.sessions_offset:self.sessions_offset + SESSION_ROWS]):
+                status = session.get_status()
+                row_color = color.DARK_LIME if status == "Done" else color.RED if status == "Error" else color.YELLOW
+                if draw.draw_color_text_button(30, 117 + row * 47, self.s_width - 60, 40, self, self.screen, f"#{session.number}   {format_time(session.recorder.get_record_time())[:-3]}   {status}", font.HP_SIMPLIFIED_22, row_color, (-30, -30, -30), color.BLACK)[1] and status != "Saving":
+                    print(f"CONTROLLER: Show session #{session.number}.")
+                    self.session = session
+                    self.state = S_SHOW_RECORD_RESULT if session.result is not None else S_RECOGNIZE_RECORD
+            if draw.draw_color_text_button(30, 270, 240, 40, self, self.screen, "Record next", font.HP_SIMPLIFIED_22, color.PURPLE, (30, 30, 30), color.WHITE)[1]:
+                self.start_record()
             if draw.draw_color_text_button(280, 270, 240, 40, self, self.screen, "Back to Menu", font.HP_SIMPLIFIED_22, color.ORANGE, (-30, -30, -30), color.BLACK)[1]:
                 print("CONTROLLER: Switched back into menu.")
                 self.state = S_IDLE
@@ -487,112 +408,64 @@ class Controller(th.Thread):
             cannot_close_on_recording_msg_text.set_alpha(self.cannot_close_on_recording_msg_timer)
             self.screen.blit(cannot_close_on_recording_msg_text, (self.s_width // 2 - cannot_close_on_recording_msg_text.get_width() // 2, 20))
 
+        # Draw input stream failed message text
+        if input_stream.error and self.cannot_close_on_recording_msg_timer <= 0:
+            input_stream_failed_msg_text = font.render_text("INPUT STREAM FAILED!", font.MAIAN_25, color.RED)
+            self.screen.blit(input_stream_failed_msg_text, (self.s_width // 2 - input_stream_failed_msg_text.get_width() // 2, 20))
+
         # Draw the credit line
         draw.credit_line(self.screen, "Controller", color.WHITE, (self.s_width, self.s_height))
 
         # Flip the screen
         pg.display.flip()
 
-    # Recognize recorded audio
-    def recognize_record(self) -> None:
+    # Start a new session and record it
+    def start_record(self) -> None:
 
-        # Start recognizing
-        self.recognizing_start_time = time.time()
-        self.result = ("#LOADING#", "", "")
-        self.result = recognize_audio(recorder.frames)
+        # Do not record, if the input stream failed
+        if input_stream.error:
+            print(f"CONTROLLER: Cannot record! ({input_stream.error})")
+            return
 
-    # Wait for recorder stopped and recognize than
-    def wait_record_stop_and_recognize(self) -> None:
+        # Create a new session and forget the oldest finished sessions
+        print("CONTROLLER: Initialize a new session ...")
+        self.session = Session(self.sessions[-1].number + 1 if self.sessions else 1, Recorder(input_stream, executor, recognize_frames))
+        self.sessions.append(self.session)
+        for session in list(self.sessions):
+            if len(self.sessions) <= MAX_SESSIONS:
+                break
+            if session.result is not None:
+                self.sessions.remove(session)
+        self.sessions_offset = 0
 
-        # Join the recorder
-        recorder.join()
+        # Start recording
+        print("CONTROLLER: Run the recorder ...")
+        self.session.recorder.start()
+        self.state = S_RECORD
 
-        # Set the state to recognize record
-        self.state = S_RECOGNIZE_RECORD
+    # Stop recording and get an event, when the recorder is stopped
+    def stop_record(self) -> None:
 
-        # Recognize recorded audio
-        self.recognize_record()
+        # Stop the recorder and post the stopped event with the error of saving (or None) after saving
+        print("CONTROLLER: Waiting for recorder stopped ...")
+        session = self.session
+        session.recorder.stop().add_done_callback(lambda future: pg.event.post(pg.event.Event(E_RECORD_STOPPED, session=session, error=future.exception())))
+        self.state = S_STOP_RECORD
+
+    # Recognize the recorded audio of a session in the background and get an event, when it is finished
+    def recognize_record(self, session: Session) -> None:
+
+        # Start recognizing
+        session.recognize(recognizer_pool, recognize_frames).add_done_callback(lambda future: pg.event.post(pg.event.Event(E_RECOGNIZED, session=session, future=future)))
 
 
 # METHODS
 
-# Recognize audio
-def recognize_audio(audio_frames: list) -> tuple[str, str, str]:
-
-    # Get the SpeechRecognition audio data
-    audio_data = sp_rec.AudioData(b''.join(audio_frames), SAMPLES_PER_SECOND, pa.get_sample_size(SAMPLE_FORMAT))
-
-    # Recognize the audio data to text data
-    try:
-        print("RECOGNIZER: Recognize audio ...")
-        print("[WARNING: This can take some time ...]")
-        text_data = rec.recognize_google(audio_data, language="de")
-    except sp_rec.UnknownValueError:
-        print("RECOGNIZER: Error on recognizing! Unable to recognize data!")
-        print("--------------")
-        print("ERROR MESSAGE:")
-        error = "".join(traceback.format_exception(*sys.exc_info()))[:-1]
-        print(error)
-        print("--------------")
-        return "#ERROR#", error, "Error on recognizing: Unable to recognize data!"
-    except sp_rec.RequestError:
-        print("RECOGNIZER: Error on recognizing! Cannot request the API! Maybe no internet!")
-        print("--------------")
-        print("ERROR MESSAGE:")
-        error = "".join(traceback.format_exception(*sys.exc_info()))[:-1]
-        print(error)
-        print("--------------")
-        return "#ERROR#", error, "Error on recognizing: Cannot request the API! Maybe no internet!"
-    except Exception:
-        print("RECOGNIZER: Error on recognizing! UNKNOWN!")
-        print("--------------")
-        print("ERROR MESSAGE:")
-        error = "".join(traceback.format_exception(*sys.exc_info()))[:-1]
-        print(error)
-        print("--------------")
-        return "#ERROR#", error, "Error on recognizing: UNKNOWN!"
-
-    # Open the txt file
-    print(f"RECOGNIZER: Save text at '{OUTPUT_TEXT}' ...")
-    with open(OUTPUT_TEXT, "w") as file:
-        # Write the head
-        file.write(f"Speech Recognition Engine Result\n")
-        file.write("--------------------------------\n")
-        file.write("\n")
-
-        # Write the text
-        file.write(text_data)
-    print("RECOGNIZER: Text saved.")
-
-    # Return the text data and print confirmation
-    print("RECOGNIZER: Successfully recognized.")
-    return text_data, "", ""
-
-
-# Format time from seconds
-def format_time(time: float) -> str:
-
-    # Get time elements
-    if time // 60 // 60 >= 1:
-        return "#OVERFLOW#"
-    minutes = 0
-    if time // 60 >= 1:
-        minutes = int(time // 60)
-        time -= time // 60 * 60
-    seconds = time
-
-    # Build the string
-    if minutes < 10:
-        result = f"0{minutes}:"
-    else:
-        result = f"{minutes}:"
-    if seconds < 10:
-        result += f"0{seconds:.2f}"
-    else:
-        result += f"{seconds:.2f}"
+# Recognize the frames of a take or a segment (the controller saves the text of the newest result)
+def recognize_frames(frames: list, sample_rate: int) -> tuple[str, str, str]:
 
-    # Return the result
-    return result
+    # Return the result without saving the text
+    return recognize_audio_languages(frames, rec, LANGUAGES, sample_rate, SAMPLE_WIDTH, "")
 
 
 # Quit the application
@@ -602,6 +475,16 @@ def quit() -> None:
     print("MAIN: Quit Pygame ...")
     pg.quit()
 
+    # Stop the executor and the recognizer pool
+    print("MAIN: Stop the executor and the recognizer pool ...")
+    executor.shutdown(False, cancel_futures=True)
+    recognizer_pool.shutdown(False, cancel_futures=True)
+
+    # Stop the input stream
+    print("MAIN: Stop the input stream ...")
+    input_stream.stop()
+    input_stream.join()
+
     # Quit PyAudio
     print("MAIN: Quit PyAudio ...")
     pa.terminate()
@@ -635,17 +518,29 @@ if __name__ == '__main__':
     print("MAIN: Initialize SpeechRecognition ...")
     rec = sp_rec.Recognizer()
 
+    # Initialize the executor for saving and recognizing segments
+    print("MAIN: Initialize the executor ...")
+    executor = ThreadPoolExecutor(4, "Executor Thread")
+
+    # Initialize the recognizer pool for recognizing sessions
+    print("MAIN: Initialize the recognizer pool ...")
+    recognizer_pool = ThreadPoolExecutor(RECOGNIZER_WORKERS, "Recognizer Thread")
+
+    # Initialize and open the input stream (in a separate capture process, if enabled)
+    print("MAIN: Initialize the input stream ...")
+    if CAPTURE_PROCESS:
+        input_stream = ProcessInputStream()
+    else:
+        input_stream = InputStream(pa)
+    input_stream.start()
+
     # Initialize the controller window
     print("MAIN: Initialize the controller ...")
     controller = Controller()
 
-    # Initialize the recorder
-    print("MAIN: Initialize the recorder ...")
-    recorder = Recorder()
-
     # Initialize the player
     print("MAIN: Initialize the player ...")
-    player = Player()
+    player = Player(pa)
 
     # Print confirmation
     print("MAIN: Successfully initialized.\n")
@@ -0,0 +1,183 @@
+# IMPORTS
+
+# General
+import sys
+import time
+import traceback
+import threading as th
+from concurrent.futures import ThreadPoolExecutor
+
+# Audio
+import speech_recognition as sp_rec
+
+# Constants
+from constants import *
+
+
+# CLASSES
+
+# Mock recognizer (local stand-in for the Google recognition backend)
+class MockRecognizer:
+
+    # CONSTRUCTOR
+    def __init__(self, text: str = "Hallo! Wie geht es dir?", delay: float = 0.0, fail: bool = False, confidences: dict = None, texts: dict = None):
+
+        # Define mock variables (the texts and confidences by language fall back to the text and a confidence of 0.9)
+        self.text = text
+        self.texts = texts if texts is not None else {}
+        self.delay = delay
+        self.fail = fail
+        self.confidences = confidences if confidences is not None else {}
+        self.calls = 0
+        self.calls_lock = th.Lock()
+
+    # METHODS
+
+    # Recognize audio data like the Google API, but without network
+    def recognize_google(self, audio_data: sp_rec.AudioData, language: str = LANGUAGE, show_all: bool = False):
+
+        # Simulate the request time
+        with self.calls_lock:
+            self.calls += 1
+        if self.delay > 0:
+            time.sleep(self.delay)
+
+        # Fail like the API on empty or unrecognizable audio
+        if self.fail or len(audio_data.frame_data) == 0:
+            if show_all:
+                return []
+            raise sp_rec.UnknownValueError()
+
+        # Return the text of the language or the raw response with the confidence of the language
+        text = self.texts.get(language, self.text)
+        if show_all:
+            return {"alternative": [{"transcript": text, "confidence": self.confidences.get(language, 0.9)}], "final": True}
+        return text
+
+
+# METHODS
+
+# Recognize audio
+def recognize_audio(audio_frames: list, recognizer=None, sample_rate: int = SAMPLES_PER_SECOND, sample_width: int = SAMPLE_WIDTH, output_text: str = OUTPUT_TEXT, language: str = LANGUAGE) -> tuple[str, str, str]:
+
+    # Use a new SpeechRecognition recognizer if no one is given
+    if recognizer is None:
+        recognizer = sp_rec.Recognizer()
+
+    # Get the SpeechRecognition audio data
+    audio_data = sp_rec.AudioData(b''.join(audio_frames), sample_rate, sample_width)
+
+    # Recognize the audio data to text data
+    try:
+        print("RECOGNIZER: Recognize audio ...")
+        print("[WARNING: This can take some time ...]")
+        text_data = recognizer.recognize_google(audio_data, language=language)
+    except sp_rec.UnknownValueError:
+        print("RECOGNIZER: Error on recognizing! Unable to recognize data!")
+        print("--------------")
+        print("ERROR MESSAGE:")
+        error = "".join(traceback.format_exception(*sys.exc_info()))[:-1]
+        print(error)
+        print("--------------")
+        return "#ERROR#", error, UNRECOGNIZABLE_ERROR
+    except sp_rec.RequestError:
+        print("RECOGNIZER: Error on recognizing! Cannot request the API! Maybe no internet!")
+        print("--------------")
+        print("ERROR MESSAGE:")
+        error = "".join(traceback.format_exception(*sys.exc_info()))[:-1]
+        print(error)
+        print("--------------")
+        return "#ERROR#", error, "Error on recognizing: Cannot request the API! Maybe no internet!"
+    except Exception:
+        print("RECOGNIZER: Error on recognizing! UNKNOWN!")
+        print("--------------")
+        print("ERROR MESSAGE:")
+        error = "".join(traceback.format_exception(*sys.exc_info()))[:-1]
+        print(error)
+        print("--------------")
+        return "#ERROR#", error, "Error on recognizing: UNKNOWN!"
+
+    # Save the text, if an output file is given
+    if output_text != "":
+        save_text(text_data, output_text)
+
+    # Return the text data and print confirmation
+    print("RECOGNIZER: Successfully recognized.")
+    return text_data, "", ""
+
+
+# Recognize audio in several languages at once and keep the transcript with the highest confidence
+def recognize_audio_languages(audio_frames: list, recognizer=None, languages: tuple = LANGUAGES, sample_rate: int = SAMPLES_PER_SECOND, sample_width: int = SAMPLE_WIDTH, output_text: str = OUTPUT_TEXT) -> tuple[str, str, str]:
+
+    # Recognize a single language, if only one is given
+    if len(languages) == 1:
+        return recognize_audio(audio_frames, recognizer, sample_rate, sample_width, output_text, languages[0])
+
+    # Use a new SpeechRecognition recognizer if no one is given
+    if recognizer is None:
+        recognizer = sp_rec.Recognizer()
+
+    # Get the SpeechRecognition audio data (shared by all requests)
+    audio_data = sp_rec.AudioData(b''.join(audio_frames), sample_rate, sample_width)
+
+    # Send all requests at once and wait for the slowest
+    print(f"RECOGNIZER: Recognize audio in {', '.join(languages)} ...")
+    print("[WARNING: This can take some time ...]")
+    with ThreadPoolExecutor(len(languages), "Language Recognizer Thread") as executor:
+        futures = {language: executor.submit(recognizer.recognize_google, audio_data, language=language, show_all=True) for language in languages}
+
+    # Get the alternative with the highest confidence
+    best = None
+    errors = []
+    for language, future in futures.items():
+        try:
+            response = future.result()
+        except Exception:
+            print(f"RECOGNIZER: Error on recognizing in {language}!")
+            errors.append(f"[{language}]\n" + "".join(traceback.format_exception(*sys.exc_info()))[:-1])
+            continue
+        if not isinstance(response, dict):
+            continue
+        for alternative in response.get("alternative", []):
+            confidence = alternative.get("confidence", 0.0)
+            if "transcript" in alternative and (best is None or confidence > best[2]):
+                best = (alternative["transcript"], language, confidence)
+
+    # Return an error, if no language is recognized
+    if best is None:
+        error = "\n\n".join(errors)
+        if len(errors) == len(languages):
+            print("RECOGNIZER: Error on recognizing! Cannot request the API! Maybe no internet!")
+            print("--------------")
+            print("ERROR MESSAGE:")
+            print(error)
+            print("--------------")
+            return "#ERROR#", error, "Error on recognizing: Cannot request the API! Maybe no internet!"
+        print("RECOGNIZER: Error on recognizing! Unable to recognize data!")
+        return "#ERROR#", error, UNRECOGNIZABLE_ERROR
+
+    # Save the text, if an output file is given
+    text_data, language, confidence = best
+    if output_text != "":
+        save_text(text_data, output_text)
+
+    # Return the text data and print confirmation
+    print(f"RECOGNIZER: Successfully recognized. (Language: {language}, Confidence: {confidence:.2f})")
+    return text_data, "", ""
+
+
+# Save a recognized text to file
+def save_text(text_data: str, output_text: str = OUTPUT_TEXT) -> None:
+
+    # Open the txt file
+    print(f"RECOGNIZER: Save text at '{output_text}' ...")
+    with open(output_text, "w") as file:
+
+        # Write the head
+        file.write(f"Speech Recognition Engine Result\n")
+        file.write("--------------------------------\n")
+        file.write("\n")
+
+        # Write the text
+        file.write(text_data)
+    print("RECOGNIZER: Text saved.")
@@ -0,0 +1,359 @@
+# IMPORTS
+
+# General
+import os
+import sys
+import json
+import time
+import traceback
+import threading as th
+from concurrent.futures import Executor, Future, wait
+
+# Audio
+import wave
+
+# Recognizer
+from recognizer import save_text
+
+# Constants
+from constants import *
+
+
+# CLASSES
+
+# Recorder
+class Recorder:
+
+    # CONSTRUCTOR
+    def __init__(self, input_stream, executor: Executor, recognize=None, segment_length: float = SEGMENT_SECONDS, segment_root: str = SEGMENT_DIRECTORY):
+
+        # Define recorder variables
+        self.input_stream = input_stream
+        self.executor = executor
+        self.recording = False
+        self.frames = []
+        self.frames_size = 0
+        self.sample_rate = SAMPLES_PER_SECOND
+        self.record_start_time = 0
+        self.record_end_time = 0
+
+        # Define segment variables (the recognize function gets the frames and the sample rate)
+        self.recognize = recognize
+        self.segment_length = segment_length
+        self.segment_root = segment_root
+        self.segment_directory = ""
+        self.segments = []
+        self.segment_futures = []
+        self.manifest_lock = th.Lock()
+
+        # Print confirmation
+        print("RECORDER: Initialized.")
+
+
+    # METHODS
+
+    # Start recording
+    def start(self) -> None:
+
+        # Set recording to true and take the sample rate of the input stream
+        self.recording = True
+        self.sample_rate = self.input_stream.sample_rate
+
+        # Attach to the input stream and set the start record time before the pre-roll
+        self.record_start_time = time.time() - self.input_stream.attach(self)
+        self.record_end_time = time.time()
+        print("RECORDER: Start recording ...")
+
+    # Stop recording and return the future of saving the audio
+    def stop(self, output_audio: str = OUTPUT_AUDIO) -> Future:
+
+        # Set recording to false and detach from the input stream
+        self.recording = False
+        self.input_stream.detach(self)
+        print(f"RECORDER: Stopped recording. (Length: {format_time(self.get_record_time())})")
+
+        # Close the last segment, if the recording is already split into segments
+        if self.segments:
+            if self.frames:
+                self.close_segment()
+            future = Future()
+            future.set_result(None)
+            return future
+
+        # Save the audio in the background
+        return self.executor.submit(self.save, output_audio)
+
+    # Add a chunk and roll over into a new segment, when the segment is full
+    def add_frame(self, data: bytes) -> None:
+
+        # Append the chunk
+        self.frames.append(data)
+        self.frames_size += len(data)
+        self.record_end_time = time.time()
+
+        # Close the segment, if it is full
+        if self.frames_size >= int(self.segment_length * self.sample_rate) * SAMPLE_WIDTH * CHANNELS:
+            self.close_segment()
+
+    # Close the current segment and save and recognize it in the background
+    def close_segment(self) -> None:
+
+        # Create the segment directory on the first segment
+        if not self.segment_directory:
+            self.segment_directory = os.path.join(self.segment_root, time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(self.record_start_time or None)))
+            os.makedirs(self.segment_directory, exist_ok=True)
+            print(f"RECORDER: Split recording into segments at '{self.segment_directory}'.")
+
+        # Take the frames and start a new segment
+        frames = self.frames
+        start = sum(segment["length"] for segment in self.segments)
+        segment = {"index": len(self.segments) + 1, "file": f"segment_{len(self.segments) + 1:04d}.wav", "start": start, "length": self.frames_size / (self.sample_rate * SAMPLE_WIDTH * CHANNELS), "status": "saving", "saved": False, "text": "", "error": "", "report": ""}
+        self.segments.append(segment)
+        self.frames = []
+        self.frames_size = 0
+
+        # Save and recognize the segment in the background
+        self.segment_futures.append(self.executor.submit(self.finish_segment, segment, frames))
+
+    # Save and recognize a closed segment and update the manifest
+    def finish_segment(self, segment: dict, frames: list) -> None:
+
+        # Save the segment
+        try:
+            self.save_frames(frames, os.path.join(self.segment_directory, segment["file"]))
+        except Exception:
+            self.set_segment_result(segment, ("#ERROR#", "".join(traceback.format_exception(*sys.exc_info()))[:-1], "Error on saving the segment!"))
+            return
+        with self.manifest_lock:
+            segment["status"] = "saved"
+            segment["saved"] = True
+            self.save_manifest()
+
+        # Recognize the segment
+        if self.recognize is not None:
+            self.set_segment_result(segment, self.recognize(frames, self.sample_rate))
+
+    # Recognize a failed segment again from its saved file
+    def retry_segment(self, segment: dict) -> None:
+
+        # Read the frames of the segment
+        try:
+            with wave.open(os.path.join(self.segment_directory, segment["file"]), "rb") as file:
+                frames = [file.readframes(file.getnframes())]
+        except Exception:
+            self.set_segment_result(segment, ("#ERROR#", "".join(traceback.format_exception(*sys.exc_info()))[:-1], "Error on reading the segment!"))
+            return
+
+        # Recognize the segment
+        self.set_segment_result(segment, self.recognize(frames, self.sample_rate))
+
+    # Recognize all failed segments again in the background
+    def retry_segments(self) -> None:
+
+        # Take the failed segments
+        if self.recognize is None:
+            return
+        with self.manifest_lock:
+            segments = [segment for segment in self.segments if segment["status"] == "error"]
+            for segment in segments:
+                segment["status"] = "saved"
+
+        # Recognize every failed segment again
+        for segment in segments:
+            print(f"RECORDER: Recognize segment {segment['index']} again ...")
+            self.segment_futures.append(self.executor.submit(self.retry_segment, segment))
+
+    # Store the text or the error of a segment in the manifest
+    def set_segment_result(self, segment: dict, result: tuple[str, str, str]) -> None:
+
+        # Update the segment and save the manifest
+        with self.manifest_lock:
+            if result[0] == "#ERROR#":
+                segment.update(status="error", text="", error=result[2], report=result[1])
+            else:
+                segment.update(status="recognized", text=result[0], error="", report="")
+            self.save_manifest()
+
+    # Save the manifest of the segments
+    def save_manifest(self) -> None:
+
+        # Open the json file
+        with open(os.path.join(self.segment_directory, SEGMENT_MANIFEST), "w") as file:
+
+            # Write the data
+            json.dump({"sample_rate": self.sample_rate, "sample_width": SAMPLE_WIDTH, "channels": CHANNELS, "segment_length": self.segment_length, "segments": self.segments}, file, indent=4)
+
+    # Wait for all segments and get the joined result of them (an error, if any segment failed)
+    def get_segments_result(self, output_text: str = OUTPUT_TEXT) -> tuple[str, str, str]:
+
+        # Wait for all segments
+        wait(self.segment_futures)
+
+        # Copy the segments
+        with self.manifest_lock:
+            segments = [dict(segment) for segment in self.segments]
+
+        # Return an error with the reports of the failed segments and the partial text, if any segment failed
+        failed = [segment for segment in segments if segment["status"] != "recognized"]
+        if failed:
+            print(f"RECORDER: {len(failed)} of {len(segments)} segments failed!")
+            reports = []
+            for segment in failed:
+                head = f"[Segment {segment['index']} ({format_time(segment['start'])} - {format_time(segment['start'] + segment['length'])})]"
+                reports.append(f"{head}\n{segment['error'] or 'Not recognized!'}\n{segment['report']}".rstrip())
+            texts = [segment["text"] for segment in segments if segment["text"]]
+            if texts:
+                reports.append("[Recognized text of the other segments]\n" + " ".join(texts))
+            return "#ERROR#", "\n\n".join(reports), f"Error on recognizing: {len(failed)} of {len(segments)} segments failed!"
+
+        # Join the recognized texts
+        text_data = " ".join(segment["text"] for segment in segments if segment["text"])
+
+        # Save the text, if an output file is given
+        if output_text != "":
+            save_text(text_data, output_text)
+        return text_data, "", ""
+
+    # Get the files of all saved segments
+    def get_segment_files(self) -> list:
+
+        # Return the paths
+        with self.manifest_lock:
+            return [os.path.join(self.segment_directory, segment["file"]) for segment in self.segments if segment["saved"]]
+
+    # Save the recorded audio to file
+    def save(self, output_audio: str = OUTPUT_AUDIO) -> None:
+
+        # Save the frames
+        self.save_frames(self.frames, output_audio)
+
+    # Save frames to a wav file
+    def save_frames(self, frames: list, output_audio: str) -> None:
+
+        # Open the wav file
+        print(f"RECORDER: Save audio at '{output_audio}' ...")
+        with wave.open(output_audio, "wb") as file:
+
+            # Set the data
+            file.setnchannels(CHANNELS)
+            file.setsampwidth(SAMPLE_WIDTH)
+            file.setframerate(self.sample_rate)
+
+            # Write the frames
+            file.writeframes(b''.join(frames))
+        print(f"RECORDER: Audio saved.")
+
+    # Get recording time
+    def get_record_time(self) -> float:
+
+        # Return the calculated time
+        if self.record_start_time == 0 or self.record_end_time == 0:
+            return 0
+        else:
+            return float(f"{self.record_end_time - self.record_start_time:.2f}")
+
+
+# Player
+class Player(th.Thread):
+
+    # CONSTRUCTOR
+    def __init__(self, audio):
+
+        # Initialize thread
+        th.Thread.__init__(self, name="Player Thread")
+
+        # Define player variables
+        self.audio = audio
+        self.playing = False
+        self.stream = None
+        self.frames = []
+        self.files = []
+        self.sample_rate = SAMPLES_PER_SECOND
+
+        # Print confirmation
+        print("PLAYER: Initialized.")
+
+
+    # METHODS
+
+    # Run and start playing
+    def run(self) -> None:
+
+        # Create and open a audio stream
+        self.stream = self.audio.open(format=SAMPLE_FORMAT, channels=CHANNELS, rate=self.sample_rate, frames_per_buffer=CHUNK_SIZE, output=True)
+
+        # Set playing to true
+        self.playing = True
+
+        # Playing loop (stop on an unreadable file)
+        print("PLAYER: Start playing ...")
+        try:
+            for data in self.get_chunks():
+                if not self.playing:
+                    break
+                self.stream.write(data)
+        except (OSError, EOFError, wave.Error) as error:
+            print(f"PLAYER: Error on playing! ({error})")
+
+        # Stop and close the stream
+        finally:
+            print("PLAYER: Stopped playing.")
+            self.playing = False
+            self.stream.stop_stream()
+            self.stream.close()
+
+    # Stop playing
+    def stop(self) -> None:
+
+        # Set playing to false
+        self.playing = False
+
+    # Get the chunks to play from the files (read one by one) or the frames
+    def get_chunks(self):
+
+        # Yield the frames, if there are no files
+        if not self.files:
+            yield from self.frames
+            return
+
+        # Yield the chunks of every file
+        for path in self.files:
+            with wave.open(path, "rb") as file:
+                data = file.readframes(CHUNK_SIZE)
+                while data:
+                    yield data
+                    data = file.readframes(CHUNK_SIZE)
+
+
+# METHODS
+
+# Format time from seconds
+def format_time(time: float) -> str:
+
+    # Get time elements
+    hours = 0
+    if time // 60 // 60 >= 1:
+        hours = int(time // 60 // 60)
+        time -= hours * 60 * 60
+    minutes = 0
+    if time // 60 >= 1:
+        minutes = int(time // 60)
+        time -= time // 60 * 60
+    seconds = time
+
+    # Build the string
+    if hours > 0:
+        result = f"{hours}:"
+    else:
+        result = ""
+    if minutes < 10:
+        result += f"0{minutes}:"
+    else:
+        result += f"{minutes}:"
+    if seconds < 10:
+        result += f"0{seconds:.2f}"
+    else:
+        result += f"{seconds:.2f}"
+
+    # Return the result
+    return result
@@ -0,0 +1,455 @@
+# IMPORTS
+
+# General
+import sys
+import io
+import json
+import time
+import uuid
+import queue
+import argparse
+import threading as th
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qs
+
+# Server
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Audio
+import speech_recognition as sp_rec
+import wave
+
+# Recognizer
+from recognizer import recognize_audio_languages, MockRecognizer
+
+# Constants
+from constants import *
+
+
+# CLASSES
+
+# Recognition job
+class Job:
+
+    # CONSTRUCTOR
+    def __init__(self, audio: bytes, sample_rate: int, sample_width: int, languages: tuple):
+
+        # Define job variables
+        self.id = uuid.uuid4().hex[:12]
+        self.audio = audio
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.languages = languages
+        self.audio_length = len(audio) / (sample_rate * sample_width)
+        self.status = "queued"
+        self.partials = []
+        self.result = None
+        self.created_time = time.time()
+        self.start_time = 0
+        self.end_time = 0
+        self.changed = th.Condition()
+
+
+    # METHODS
+
+    # Add a partial text and notify the waiting streams
+    def add_partial(self, text: str) -> None:
+
+        # Append the text
+        with self.changed:
+            self.partials.append(text)
+            self.changed.notify_all()
+
+    # Finish the job and notify the waiting streams
+    def finish(self, result: tuple[str, str, str]) -> None:
+
+        # Set the result
+        with self.changed:
+            self.result = result
+            self.status = "error" if result[0] == "#ERROR#" else "done"
+            self.end_time = time.time()
+            self.audio = b""
+            self.changed.notify_all()
+
+    # Get the job data as dictionary
+    def to_dict(self) -> dict:
+
+        # Build the dictionary
+        data = {"id": self.id, "status": self.status, "languages": list(self.languages), "audio_length": round(self.audio_length, 2), "partials": list(self.partials)}
+        if self.result is not None:
+            if self.result[0] == "#ERROR#":
+                data["error"] = self.result[2]
+            else:
+                data["text"] = self.result[0]
+            data["recognition_time"] = round(self.end_time - self.start_time, 2)
+        return data
+
+
+# Recognition worker
+class Worker(th.Thread):
+
+    # CONSTRUCTOR
+    def __init__(self, service, number: int):
+
+        # Initialize thread
+        th.Thread.__init__(self, name=f"Recognition Worker Thread {number}", daemon=True)
+
+        # Define worker variables
+        self.service = service
+
+
+    # METHODS
+
+    # Run and work off the queue
+    def run(self) -> None:
+
+        # Working loop
+        while True:
+
+            # Get the next job, stop on None
+            job = self.service.jobs_queue.get()
+            if job is None:
+                break
+
+            # Recognize the job
+            try:
+                self.recognize(job)
+            finally:
+                self.service.jobs_queue.task_done()
+
+    # Recognize a job in parts and publish the partial results
+    def recognize(self, job: Job) -> None:
+
+        # Start the job
+        job.start_time = time.time()
+        job.status = "running"
+
+        # Recognize every part of the audio
+        part_size = int(SERVER_PARTIAL_SECONDS * job.sample_rate) * job.sample_width
+        texts = []
+        error = None
+        result = None
+        for offset in range(0, max(len(job.audio), 1), part_size):
+            result = recognize_audio_languages([job.audio[offset:offset + part_size]], self.service.recognizer, job.languages, job.sample_rate, job.sample_width, "")
+
+            # Skip unrecognizable parts (like silence), but stop on any other error
+            if result[0] == "#ERROR#":
+                if result[2] == UNRECOGNIZABLE_ERROR:
+                    continue
+                error = result
+                break
+            texts.append(result[0])
+            job.add_partial(result[0])
+
+        # Finish the job
+        if error is not None:
+            job.finish(error)
+        elif texts:
+            job.finish((" ".join(texts), "", ""))
+        else:
+            job.finish(result)
+        self.service.count_finished(job)
+
+
+# Recognition service
+class RecognitionService:
+
+    # CONSTRUCTOR
+    def __init__(self, recognizer=None, workers: int = SERVER_WORKERS, queue_size: int = SERVER_QUEUE_SIZE):
+
+        # Define service variables
+        self.recognizer = recognizer if recognizer is not None else sp_rec.Recognizer()
+        self.jobs_queue = queue.Queue(queue_size)
+        self.jobs = OrderedDict()
+        self.jobs_lock = th.Lock()
+        self.workers = [Worker(self, i + 1) for i in range(workers)]
+        self.start_time = 0
+        self.finished_jobs = 0
+        self.failed_jobs = 0
+        self.recognized_audio_time = 0
+
+        # Print confirmation
+        print(f"SERVICE: Initialized. (Workers: {workers}, Queue size: {queue_size})")
+
+
+    # METHODS
+
+    # Start the workers
+    def start(self) -> None:
+
+        # Start all workers
+        self.start_time = time.time()
+        for worker in self.workers:
+            worker.start()
+        print("SERVICE: Started workers.")
+
+    # Stop the workers after the queued jobs
+    def stop(self) -> None:
+
+        # Send a stop signal to every worker and wait for them
+        for _ in self.workers:
+            self.jobs_queue.put(None)
+        for worker in self.workers:
+            worker.join()
+        print("SERVICE: Stopped workers.")
+
+    # Submit audio to recognize, raises queue.Full if the queue is full
+    def submit(self, audio: bytes, sample_rate: int = SAMPLES_PER_SECOND, sample_width: int = SAMPLE_WIDTH, languages: tuple = (LANGUAGE,)) -> Job:
+
+        # Create the job and put it into the queue
+        job = Job(audio, sample_rate, sample_width, languages)
+        self.jobs_queue.put_nowait(job)
+
+        # Store the job and forget the oldest finished jobs
+        with self.jobs_lock:
+            self.jobs[job.id] = job
+            for job_id in list(self.jobs):
+                if len(self.jobs) <= SERVER_MAX_JOBS:
+                    break
+                if self.jobs[job_id].result is not None:
+                    del self.jobs[job_id]
+        print(f"SERVICE: Queued job '{job.id}'. (Length: {job.audio_length:.2f} sec)")
+        return job
+
+    # Get a job by id
+    def get(self, job_id: str) -> Job:
+
+        # Return the job
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    # Count a finished job
+    def count_finished(self, job: Job) -> None:
+
+        # Update the counters
+        with self.jobs_lock:
+            if job.status == "error":
+                self.failed_jobs += 1
+            else:
+                self.finished_jobs += 1
+            self.recognized_audio_time += job.audio_length
+        print(f"SERVICE: Finished job '{job.id}'. (Status: {job.status})")
+
+    # Get the service statistics
+    def stats(self) -> dict:
+
+        # Calculate the statistics
+        with self.jobs_lock:
+            uptime = max(time.time() - self.start_time, 0.001)
+            running = sum(1 for job in self.jobs.values() if job.status == "running")
+            return {
+                "queue_depth": self.jobs_queue.qsize(),
+                "queue_size": self.jobs_queue.maxsize,
+                "workers": len(self.workers),
+                "running_jobs": running,
+                "finished_jobs": self.finished_jobs,
+                "failed_jobs": self.failed_jobs,
+                "uptime": round(uptime, 2),
+                "jobs_per_minute": round((self.finished_jobs + self.failed_jobs) / uptime * 60, 3),
+                "audio_seconds_per_second": round(self.recognized_audio_time / uptime, 3)
+            }
+
+
+# Request handler
+class RequestHandler(BaseHTTPRequestHandler):
+
+    # VARIABLES
+    protocol_version = "HTTP/1.1"
+    service = None
+
+
+    # METHODS
+
+    # Handle GET requests
+    def do_GET(self) -> None:
+
+        # Get the path parts
+        parts = [part for part in urlparse(self.path).path.split("/") if part]
+
+        # Send the statistics
+        if parts == ["stats"]:
+            self.send_json(200, self.service.stats())
+            return
+
+        # Send the job status or stream
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self.service.get(parts[1])
+            if job is None:
+                self.send_json(404, {"error": "Unknown job id!"})
+            elif len(parts) == 2:
+                self.send_json(200, job.to_dict())
+            elif parts[2] == "stream":
+                self.stream_job(job)
+            else:
+                self.send_json(404, {"error": "Not found!"})
+            return
+
+        # Send not found
+        self.send_json(404, {"error": "Not found!"})
+
+    # Handle POST requests
+    def do_POST(self) -> None:
+
+        # Check the path (close the connection, because the unread body would be taken as the next request)
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/jobs":
+            self.close_connection = True
+            self.send_json(404, {"error": "Not found!"})
+            return
+
+        # Read the uploaded audio
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = 0
+        if length <= 0 or length > SERVER_MAX_UPLOAD_SIZE:
+            self.close_connection = True
+            self.send_json(413 if length > 0 else 400, {"error": "Invalid upload size!"})
+            return
+        body = self.rfile.read(length)
+
+        # Get the languages (without duplicates, because every language is a request to the API)
+        query = parse_qs(url.query)
+        languages = tuple(dict.fromkeys(language.strip() for language in query.get("languages", [LANGUAGE])[0].split(",") if language.strip()))
+        if not languages or len(languages) > SERVER_MAX_LANGUAGES:
+            self.send_json(400, {"error": f"Invalid languages! Give 1 to {SERVER_MAX_LANGUAGES} languages."})
+            return
+
+        # Get the audio data from a WAV file or from raw PCM
+        try:
+            if body[:4] == b"RIFF":
+                audio, sample_rate, sample_width = read_wav(body)
+            else:
+                audio = body
+                sample_rate = int(query.get("rate", [SAMPLES_PER_SECOND])[0])
+                sample_width = int(query.get("width", [SAMPLE_WIDTH])[0])
+                if sample_rate <= 0 or sample_width not in (1, 2, 3, 4):
+                    raise ValueError("Invalid PCM format!")
+        except (ValueError, EOFError, wave.Error) as error:
+            self.send_json(400, {"error": f"Invalid audio: {error}"})
+            return
+
+        # Submit the job
+        try:
+            job = self.service.submit(audio, sample_rate, sample_width, languages)
+        except queue.Full:
+            self.send_json(503, {"error": "Queue is full! Try again later."})
+            return
+        self.send_json(202, job.to_dict())
+
+    # Send a JSON response
+    def send_json(self, code: int, data: dict) -> None:
+
+        # Send the head and the body
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Stream the partial results of a job as JSON lines
+    def stream_job(self, job: Job) -> None:
+
+        # Send the head
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        # Send every partial until the job is finished
+        sent = 0
+        while True:
+            with job.changed:
+                job.changed.wait_for(lambda: len(job.partials) > sent or job.result is not None, 30)
+                partials = job.partials[sent:]
+                finished = job.result is not None
+            for text in partials:
+                self.send_chunk({"partial": text})
+            sent += len(partials)
+            if finished:
+                self.send_chunk(job.to_dict())
+                break
+
+        # Send the last chunk
+        self.wfile.write(b"0\r\n\r\n")
+
+    # Send a chunk of a chunked response
+    def send_chunk(self, data: dict) -> None:
+
+        # Write the chunk
+        line = json.dumps(data).encode() + b"\n"
+        self.wfile.write(f"{len(line):X}\r\n".encode() + line + b"\r\n")
+        self.wfile.flush()
+
+    # Log the requests with the service prefix
+    def log_message(self, format: str, *args) -> None:
+        print(f"SERVER: {self.address_string()} - {format % args}")
+
+
+# METHODS
+
+# Read the mono PCM data of a WAV file
+def read_wav(data: bytes) -> tuple[bytes, int, int]:
+
+    # Open the wav file
+    with wave.open(io.BytesIO(data), "rb") as file:
+
+        # Check the channels
+        if file.getnchannels() != 1:
+            raise ValueError("Only mono audio is supported!")
+
+        # Return the frames and the format
+        return file.readframes(file.getnframes()), file.getframerate(), file.getsampwidth()
+
+
+# Create the HTTP server for a recognition service
+def create_server(service: RecognitionService, host: str = SERVER_HOST, port: int = SERVER_PORT) -> ThreadingHTTPServer:
+
+    # Create a handler class bound to the service
+    handler = type("ServiceRequestHandler", (RequestHandler,), {"service": service})
+
+    # Return the server
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+# MAIN
+if __name__ == '__main__':
+
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description=f"Speech Recognition Engine (by {AUTHOR}) [{VERSION}] - Server")
+    parser.add_argument("--host", default=SERVER_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="port to listen on")
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS, help="number of recognition workers")
+    parser.add_argument("--queue-size", type=int, default=SERVER_QUEUE_SIZE, help="maximum number of waiting jobs")
+    parser.add_argument("--mock", action="store_true", help="use the local mock recognizer instead of the Google API")
+    args = parser.parse_args()
+
+    # Print head
+    print("Speech Recognition Engine - Server")
+    print("----------------------------------")
+    print("")
+    print(f"Author: {AUTHOR}")
+    print(f"Version: {VERSION}")
+    print("")
+
+    # Initialize the service
+    print("MAIN: Initialize the recognition service ...")
+    service = RecognitionService(MockRecognizer() if args.mock else None, args.workers, args.queue_size)
+    service.start()
+
+    # Run the server
+    server = create_server(service, args.host, args.port)
+    print(f"MAIN: Listen on http://{args.host}:{args.port} ...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("MAIN: Stop the server ...")
+    server.server_close()
+    service.stop()
+    print("MAIN: Exit ...")
+    sys.exit(0)
@@ -0,0 +1,76 @@
+# IMPORTS
+
+# General
+import time
+from concurrent.futures import Executor, Future
+
+# Recorder
+from recorder import Recorder
+
+
+# CLASSES
+
+# Session (one take with its own recorder, recognition and result)
+class Session:
+
+    # CONSTRUCTOR
+    def __init__(self, number: int, recorder: Recorder):
+
+        # Define session variables
+        self.number = number
+        self.recorder = recorder
+        self.recognition = None
+        self.result = None
+        self.recognizing_start_time = 0
+        self.recognizing_end_time = 0
+
+        # Print confirmation
+        print(f"SESSION: Initialized session #{number}.")
+
+
+    # METHODS
+
+    # Recognize the recorded audio in the pool and return the future (the recognize function gets the frames and the sample rate, failed segments are recognized again)
+    def recognize(self, pool: Executor, recognize) -> Future:
+
+        # Reset the result and start recognizing
+        self.result = None
+        self.recognizing_start_time = time.time()
+        if self.recorder.segments:
+            self.recorder.retry_segments()
+            self.recognition = pool.submit(self.recorder.get_segments_result, "")
+        else:
+            self.recognition = pool.submit(recognize, self.recorder.frames, self.recorder.sample_rate)
+        return self.recognition
+
+    # Set the result of a finished recognition
+    def finish(self, future: Future) -> bool:
+
+        # Ignore the result of a replaced recognition
+        if future is not self.recognition:
+            return False
+
+        # Set the result
+        self.recognizing_end_time = time.time()
+        self.result = future.result()
+        return True
+
+    # Get the status text
+    def get_status(self) -> str:
+
+        # Return the status
+        if self.recorder.recording:
+            return "Recording"
+        if self.result is not None:
+            return "Error" if self.result[0] == "#ERROR#" else "Done"
+        if self.recognition is not None:
+            return "Recognizing"
+        return "Saving"
+
+    # Get the recognizing time
+    def get_recognizing_time(self) -> float:
+
+        # Return the time until now, if the recognition is not finished
+        if self.result is None:
+            return time.time() - self.recognizing_start_time
+        return self.recognizing_end_time - self.recognizing_start_time
@@ -0,0 +1,46 @@
+# IMPORTS
+
+# General
+import time
+
+# Recognizer
+from recognizer import recognize_audio_languages, MockRecognizer
+
+# Constants
+from constants import *
+
+
+# TESTS
+
+# Keep the transcript of the language with the highest confidence
+def test_best_language():
+
+    # Recognize with the english transcript as the most confident one
+    recognizer = MockRecognizer(texts={"de": "Hallo", "en-US": "Hello", "fr": "Bonjour"}, confidences={"de": 0.6, "en-US": 0.95, "fr": 0.3})
+    assert recognize_audio_languages([b"\x01\x00" * 100], recognizer, ("de", "en-US", "fr"), 16000, 2, "") == ("Hello", "", "")
+    assert recognizer.calls == 3
+
+    # Recognize with the german transcript as the most confident one
+    recognizer = MockRecognizer(texts={"de": "Hallo", "en-US": "Hello"}, confidences={"de": 0.8, "en-US": 0.7})
+    assert recognize_audio_languages([b"\x01\x00" * 100], recognizer, ("de", "en-US"), 16000, 2, "")[0] == "Hallo"
+
+
+# Send the requests of all languages at once
+def test_languages_in_parallel():
+
+    # Recognize three languages with a slow recognizer
+    recognizer = MockRecognizer(delay=0.5)
+    start_time = time.perf_counter()
+    result = recognize_audio_languages([b"\x01\x00" * 100], recognizer, ("de", "en-US", "fr"), 16000, 2, "")
+    elapsed = time.perf_counter() - start_time
+    assert result[0] == "Hallo! Wie geht es dir?"
+    assert 0.5 <= elapsed < 1.0
+
+
+# Return an error, if no language is recognized
+def test_unrecognizable():
+
+    # Recognize with a failing recognizer
+    result = recognize_audio_languages([b"\x01\x00" * 100], MockRecognizer(fail=True), ("de", "en-US"), 16000, 2, "")
+    assert result[0] == "#ERROR#"
+    assert result[2] == UNRECOGNIZABLE_ERROR
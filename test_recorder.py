@@ -0,0 +1,202 @@
+# IMPORTS
+
+# General
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Testing
+import pytest
+
+# Audio
+import wave
+
+# Recorder
+from recorder import Recorder, Player
+
+# Constants
+from constants import *
+
+
+# CLASSES
+
+# Fake input stream (passes nothing on its own, the tests add the frames)
+class FakeInputStream:
+
+    # VARIABLES
+    sample_rate = 1000
+
+    # METHODS
+
+    # Attach a recorder without pre-roll
+    def attach(self, recorder) -> float:
+        return 0
+
+    # Detach a recorder
+    def detach(self, recorder) -> None:
+        pass
+
+
+# Fake recognizer (returns the value of the first byte as text and fails for the given values)
+class FakeRecognizer:
+
+    # CONSTRUCTOR
+    def __init__(self, failing: set = None):
+
+        # Define fake variables
+        self.failing = failing if failing is not None else set()
+        self.frames = []
+
+    # METHODS
+
+    # Recognize the frames of a segment
+    def __call__(self, frames: list, sample_rate: int) -> tuple[str, str, str]:
+
+        # Return the error or the text
+        data = b"".join(frames)
+        self.frames.append(data)
+        if data[0] in self.failing:
+            return "#ERROR#", f"Traceback: segment {data[0]}", "Error on recognizing: Cannot request the API! Maybe no internet!"
+        return f"text{data[0]}", "", ""
+
+
+# FIXTURES
+
+# Executor for the segments
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+# METHODS
+
+# Record the given seconds (every second of audio consists of bytes of its number) and stop
+def record(recorder: Recorder, seconds: float) -> None:
+
+    # Add chunks of a quarter second
+    recorder.start()
+    for i in range(int(seconds * 4)):
+        recorder.add_frame(bytes([i // 4 + 1]) * (FakeInputStream.sample_rate * SAMPLE_WIDTH * CHANNELS // 4))
+    recorder.stop()
+    wait(recorder.segment_futures)
+
+
+# Read the manifest of a recorder
+def read_manifest(recorder: Recorder) -> dict:
+    with open(os.path.join(recorder.segment_directory, SEGMENT_MANIFEST)) as file:
+        return json.load(file)
+
+
+# TESTS
+
+# Roll over into segment files and recognize every segment
+def test_rollover(executor, tmp_path):
+
+    # Record three and a half segments
+    recognizer = FakeRecognizer()
+    recorder = Recorder(FakeInputStream(), executor, recognizer, segment_length=1, segment_root=str(tmp_path))
+    record(recorder, 3.5)
+
+    # Check the segment files
+    files = recorder.get_segment_files()
+    assert [os.path.basename(path) for path in files] == ["segment_0001.wav", "segment_0002.wav", "segment_0003.wav", "segment_0004.wav"]
+    with wave.open(files[1], "rb") as file:
+        assert file.getframerate() == FakeInputStream.sample_rate
+        assert file.readframes(file.getnframes()) == bytes([2]) * 2000
+
+    # Check the manifest
+    manifest = read_manifest(recorder)
+    assert manifest["sample_rate"] == FakeInputStream.sample_rate
+    assert [segment["start"] for segment in manifest["segments"]] == [0, 1, 2, 3]
+    assert [segment["length"] for segment in manifest["segments"]] == [1, 1, 1, 0.5]
+    assert all(segment["status"] == "recognized" and segment["saved"] for segment in manifest["segments"])
+
+    # Check the joined result
+    assert recorder.get_segments_result("") == ("text1 text2 text3 text4", "", "")
+
+
+# Report the failed segments with the text of the other segments
+def test_failed_segment(executor, tmp_path):
+
+    # Record three segments, where the second fails
+    recorder = Recorder(FakeInputStream(), executor, FakeRecognizer({2}), segment_length=1, segment_root=str(tmp_path))
+    record(recorder, 3)
+
+    # Check the manifest
+    segment = read_manifest(recorder)["segments"][1]
+    assert segment["status"] == "error"
+    assert segment["error"] == "Error on recognizing: Cannot request the API! Maybe no internet!"
+    assert segment["report"] == "Traceback: segment 2"
+
+    # Check the result
+    text, report, message = recorder.get_segments_result("")
+    assert text == "#ERROR#"
+    assert message == "Error on recognizing: 1 of 3 segments failed!"
+    assert "[Segment 2 (00:01.00 - 00:02.00)]" in report
+    assert "Traceback: segment 2" in report
+    assert report.endswith("text1 text3")
+
+
+# Recognize a failed segment again from its file
+def test_retry_segments(executor, tmp_path):
+
+    # Record two segments, where the first fails
+    recognizer = FakeRecognizer({1})
+    recorder = Recorder(FakeInputStream(), executor, recognizer, segment_length=1, segment_root=str(tmp_path))
+    record(recorder, 2)
+    assert recorder.get_segments_result("")[0] == "#ERROR#"
+
+    # Recognize again with a working recognizer
+    recognizer.failing.clear()
+    recorder.retry_segments()
+    assert recorder.get_segments_result("") == ("text1 text2", "", "")
+    assert recognizer.frames[-1] == bytes([1]) * 2000
+    assert [segment["status"] for segment in read_manifest(recorder)["segments"]] == ["recognized", "recognized"]
+
+
+# Report a segment, which could not be saved, and do not play it
+def test_unsaved_segment(executor, tmp_path, monkeypatch):
+
+    # Record two segments, where saving the second fails
+    recorder = Recorder(FakeInputStream(), executor, FakeRecognizer(), segment_length=1, segment_root=str(tmp_path))
+    save_frames = recorder.save_frames
+    def fail_second(frames: list, output_audio: str) -> None:
+        if output_audio.endswith("segment_0002.wav"):
+            raise OSError("Disk full")
+        save_frames(frames, output_audio)
+    monkeypatch.setattr(recorder, "save_frames", fail_second)
+    record(recorder, 2)
+
+    # Check the result and the files
+    text, report, message = recorder.get_segments_result("")
+    assert text == "#ERROR#"
+    assert "Error on saving the segment!" in report
+    assert "Disk full" in report
+    assert [os.path.basename(path) for path in recorder.get_segment_files()] == ["segment_0001.wav"]
+
+
+# Stop playing and close the stream on an unreadable file
+def test_player_unreadable_file(tmp_path):
+
+    # Fake audio, which remembers the closed stream
+    class FakeStream:
+        closed = False
+        def write(self, data: bytes) -> None:
+            pass
+        def stop_stream(self) -> None:
+            pass
+        def close(self) -> None:
+            self.closed = True
+    class FakeAudio:
+        stream = FakeStream()
+        def open(self, **kwargs):
+            return self.stream
+
+    # Play a missing file
+    audio = FakeAudio()
+    player = Player(audio)
+    player.files = [str(tmp_path / "missing.wav")]
+    player.run()
+    assert not player.playing
+    assert audio.stream.closed
@@ -0,0 +1,240 @@
+# IMPORTS
+
+# General
+import io
+import json
+import time
+import threading as th
+import http.client
+
+# Testing
+import pytest
+
+# Audio
+import wave
+
+# Server
+from server import RecognitionService, create_server
+
+# Recognizer
+from recognizer import MockRecognizer
+
+# Constants
+from constants import *
+
+
+# FIXTURES
+
+# Running server with a mock recognizer
+@pytest.fixture
+def server():
+
+    # Start the service and the server on a free port
+    service = RecognitionService(MockRecognizer(), workers=1, queue_size=4)
+    service.start()
+    http_server = create_server(service, "127.0.0.1", 0)
+    thread = th.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield service, http_server.server_address[1]
+
+    # Stop the server and the service
+    http_server.shutdown()
+    http_server.server_close()
+    service.stop()
+
+
+# METHODS
+
+# Send a request and return the status and the JSON body
+def request(port: int, method: str, path: str, body: bytes = None) -> tuple[int, dict]:
+
+    # Send the request
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request(method, path, body)
+    response = connection.getresponse()
+    data = json.loads(response.read())
+    connection.close()
+    return response.status, data
+
+
+# Create a mono WAV file
+def create_wav(audio: bytes, sample_rate: int = 16000) -> bytes:
+
+    # Write the wav file into memory
+    data = io.BytesIO()
+    with wave.open(data, "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(sample_rate)
+        file.writeframes(audio)
+    return data.getvalue()
+
+
+# Poll a job until it is finished
+def wait_for_job(port: int, job_id: str) -> dict:
+
+    # Poll the job status
+    for _ in range(100):
+        status, job = request(port, "GET", f"/jobs/{job_id}")
+        assert status == 200
+        if job["status"] in ("done", "error"):
+            return job
+        time.sleep(0.05)
+    raise TimeoutError(f"Job '{job_id}' is not finished!")
+
+
+# TESTS
+
+# Upload a WAV file and poll the result
+def test_wav_upload(server):
+    service, port = server
+
+    # Upload and wait for the job
+    status, job = request(port, "POST", "/jobs", create_wav(b"\x01\x00" * 16000))
+    assert status == 202
+    job = wait_for_job(port, job["id"])
+    assert job["status"] == "done"
+    assert job["text"] == "Hallo! Wie geht es dir?"
+    assert job["audio_length"] == 1.0
+
+
+# Upload raw PCM with a custom format
+def test_pcm_upload(server):
+    service, port = server
+
+    # Upload and wait for the job
+    status, job = request(port, "POST", "/jobs?rate=8000&width=2&languages=de,en-US", b"\x01\x00" * 8000)
+    assert status == 202
+    assert job["languages"] == ["de", "en-US"]
+    job = wait_for_job(port, job["id"])
+    assert job["status"] == "done"
+    assert job["audio_length"] == 1.0
+
+
+# Recognize every given language only once
+def test_duplicate_languages(server):
+    service, port = server
+
+    # Upload with duplicated languages
+    status, job = request(port, "POST", "/jobs?languages=de,en-US,de,en-US,de", b"\x01\x00" * 100)
+    assert status == 202
+    assert job["languages"] == ["de", "en-US"]
+    wait_for_job(port, job["id"])
+    assert service.recognizer.calls == 2
+
+
+# Stream the partial results of a long upload
+def test_stream(server):
+    service, port = server
+
+    # Upload audio of three parts
+    sample_rate = 1000
+    status, job = request(port, "POST", f"/jobs?rate={sample_rate}&width=2", b"\x01\x00" * sample_rate * (SERVER_PARTIAL_SECONDS * 2 + 10))
+    assert status == 202
+
+    # Read the JSON lines
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request("GET", f"/jobs/{job['id']}/stream")
+    response = connection.getresponse()
+    assert response.status == 200
+    assert response.getheader("Content-Type") == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.read().splitlines() if line]
+    connection.close()
+    assert lines[:-1] == [{"partial": "Hallo! Wie geht es dir?"}] * 3
+    assert lines[-1]["status"] == "done"
+    assert len(lines[-1]["partials"]) == 3
+
+
+# Reject uploads, when the queue is full
+def test_queue_full():
+
+    # Create a server without running workers and a queue of one job
+    service = RecognitionService(MockRecognizer(), workers=0, queue_size=1)
+    http_server = create_server(service, "127.0.0.1", 0)
+    thread = th.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    port = http_server.server_address[1]
+
+    # Fill the queue
+    try:
+        assert request(port, "POST", "/jobs", b"\x01\x00" * 100)[0] == 202
+        status, data = request(port, "POST", "/jobs", b"\x01\x00" * 100)
+        assert status == 503
+        assert "error" in data
+    finally:
+        http_server.shutdown()
+        http_server.server_close()
+
+
+# Reject invalid uploads
+@pytest.mark.parametrize("path, body", [
+    ("/jobs", b""),
+    ("/jobs?rate=0", b"\x01\x00" * 100),
+    ("/jobs?width=5", b"\x01\x00" * 100),
+    ("/jobs?languages=,", b"\x01\x00" * 100),
+    ("/jobs?languages=de,en-US,fr,es,it", b"\x01\x00" * 100),
+    ("/jobs", b"RIFF" + bytes(100))
+])
+def test_bad_request(server, path, body):
+    service, port = server
+
+    # Upload the invalid data
+    status, data = request(port, "POST", path, body)
+    assert status == 400
+    assert "error" in data
+
+
+# Reject an invalid content length and close the connection
+@pytest.mark.parametrize("length, code", [(str(SERVER_MAX_UPLOAD_SIZE + 1), 413), ("abc", 400)])
+def test_invalid_length(server, length, code):
+    service, port = server
+
+    # Send only the head
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.putrequest("POST", "/jobs")
+    connection.putheader("Content-Length", length)
+    connection.endheaders()
+    response = connection.getresponse()
+    assert response.status == code
+    assert response.getheader("Connection") == "close"
+    assert "error" in json.loads(response.read())
+    connection.close()
+
+
+# Close the connection on an unknown path, because the body is not read
+def test_unknown_post_path(server):
+    service, port = server
+
+    # Upload to an unknown path
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request("POST", "/unknown", b"\x01\x00" * 100)
+    response = connection.getresponse()
+    assert response.status == 404
+    assert response.getheader("Connection") == "close"
+    connection.close()
+
+
+# Unknown jobs are not found
+def test_unknown_job(server):
+    service, port = server
+    assert request(port, "GET", "/jobs/unknown")[0] == 404
+
+
+# Count the jobs in the statistics
+def test_stats(server):
+    service, port = server
+
+    # Finish a job and check the statistics
+    status, job = request(port, "POST", "/jobs", create_wav(b"\x01\x00" * 1600))
+    wait_for_job(port, job["id"])
+    for _ in range(100):
+        status, stats = request(port, "GET", "/stats")
+        if stats["finished_jobs"]:
+            break
+        time.sleep(0.05)
+    assert status == 200
+    assert stats["workers"] == 1
+    assert stats["queue_size"] == 4
+    assert stats["finished_jobs"] == 1
+    assert stats["failed_jobs"] == 0
+    assert stats["running_jobs"] == 0